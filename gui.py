@@ -17,9 +17,10 @@ import math
 import os
 import re
 import sys
+import time
 import tkinter as tk
-from collections import defaultdict
-from datetime import datetime
+from collections import defaultdict, deque, namedtuple
+from itertools import islice
 
 # ─── Constants ────────────────────────────────────────────────────────────────
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -27,6 +28,11 @@ DEFAULT_LOG = os.path.join(SCRIPT_DIR, "outputfile.txt")
 
 POLL_MS = 300          # How often to check for new log lines (ms)
 MAX_EVENTS = 200       # Max events in the feed panel
+MAX_FEED_LINES = 1000  # Lines kept in the feed widget before trimming
+
+FORCE_LAYOUT_MIN_PEERS = 24   # Below this, live peers are placed on a circle
+LARGE_N_THRESHOLD = 64        # numpy/numba are imported only at this many peers
+USE_JIT = os.environ.get("GOSSIP_GUI_JIT", "1") != "0"   # set 0 to stay pure-Python
 
 # ─── Colors ───────────────────────────────────────────────────────────────────
 BG           = "#1e1e2e"
@@ -47,125 +53,180 @@ DEAD_COLOR   = "#f38ba8"
 HEADER_BG    = "#313244"
 STAT_FG      = "#cba6f7"
 
-# ─── Log line regex ───────────────────────────────────────────────────────────
-LINE_RE = re.compile(
-    r'\[(?P<ts>[^\]]+)\]\s+\[(?P<ntype>SEED|PEER):(?P<port>\d+)\]\s+'
-    r'(?P<level>\w+)\s+-\s+(?P<msg>.*)'
+# ─── Log line scanner ─────────────────────────────────────────────────────────
+# Lines look like  [<ts>] [SEED|PEER:<port>] <LEVEL> - <msg>.  They are split
+# with bytes.find() rather than a regex, and only the fields that are kept
+# become str.  Node types and levels map to shared constants.
+_NTYPES = {b"SEED": "SEED", b"PEER": "PEER"}
+_LEVELS = {b"DEBUG": "DEBUG", b"INFO": "INFO", b"WARNING": "WARNING",
+           b"ERROR": "ERROR", b"CRITICAL": "CRITICAL"}
+
+
+def parse_line(b: bytes):
+    """Split one raw log line into (ts, ntype, port, level, msg), or None."""
+    b = b.strip()
+    if not b.startswith(b"["):
+        return None
+    ts_end = b.find(b"]", 1)
+    if ts_end <= 1:
+        return None
+    i = ts_end + 1
+    j = b.find(b"[", i)
+    if j <= i or b[i:j].strip():
+        return None
+    colon = b.find(b":", j)
+    close = b.find(b"]", colon)
+    if colon < 0 or close < 0:
+        return None
+    ntype = _NTYPES.get(b[j + 1:colon])
+    port_b = b[colon + 1:close]
+    if ntype is None or not port_b.isdigit():
+        return None
+    dash = b.find(b" - ", close)
+    if dash < 0:
+        return None
+    level_b = b[close + 1:dash].strip()
+    level = _LEVELS.get(level_b)
+    if level is None:
+        if not level_b.isalnum():
+            return None
+        level = level_b.decode("ascii")
+    return (b[1:ts_end].decode("ascii", "replace"), ntype, int(port_b),
+            level, b[dash + 3:].lstrip().decode("utf-8", "replace"))
+
+
+# ─── Message-body regexes (compiled once, used per line) ─────────────────────
+NEIGHBORS_RE = re.compile(r"neighbors=\[([^\]]*)\]")
+PEER_ADDR_RE = re.compile(r"['\"]?([\d.]+:\d+)['\"]?", re.ASCII)
+GOSSIP_FROM_RE = re.compile(r"from=([\d.]+:\d+)", re.ASCII)
+DEAD_NODE_RE = re.compile(r"Dead Node:([\d.]+):(\d+)", re.ASCII)
+REMOVAL_RE = re.compile(r"CONFIRMED REMOVAL:\s*([\d.]+:\d+)", re.ASCII)
+
+# One alternation pass picks the handler instead of a chain of substring scans
+EVENT_RE = re.compile(
+    r"(CONSENSUS OUTCOME|PROPOSAL:|Overlay built|Generated gossip|Gossip received"
+    r"|DEAD NODE REPORT|CONFIRMED REMOVAL|Vote from|Voting)"
 )
 
 
+# ─── Force-directed layout ────────────────────────────────────────────────────
+# numpy/numba are loaded lazily by GossipGUI._load_jit(); until then the
+# kernel's outer loop is a plain range and it runs as ordinary Python.
+prange = range
+FORCE_STEPS_PER_REDRAW = 1    # Iterations per redraw, pure-Python kernel
+JIT_STEPS_PER_REDRAW = 5      # Iterations per redraw, numba kernel
+
+def _fr_step(xs, ys, dispx, dispy, indptr, indices, k, temp,
+             xmin, xmax, ymin, ymax):
+    """
+    One Fruchterman-Reingold iteration over all nodes, in place.
+
+    Repulsion is brute-force between every pair; attraction follows the
+    CSR adjacency (indptr, indices).  Written against plain indexing so
+    the same body runs on Python lists or, JIT-compiled, on numpy arrays.
+    """
+    n = len(xs)
+    k2 = k * k
+    for i in prange(n):
+        xi = xs[i]
+        yi = ys[i]
+        fx = 0.0
+        fy = 0.0
+        for j in range(n):
+            if j == i:
+                continue
+            dx = xi - xs[j]
+            dy = yi - ys[j]
+            f = k2 / (dx * dx + dy * dy + 0.01)
+            fx += dx * f
+            fy += dy * f
+        for p in range(indptr[i], indptr[i + 1]):
+            j = indices[p]
+            dx = xi - xs[j]
+            dy = yi - ys[j]
+            d = math.sqrt(dx * dx + dy * dy)
+            fx -= dx * d / k
+            fy -= dy * d / k
+        dispx[i] = fx
+        dispy[i] = fy
+
+    for i in range(n):
+        d = math.sqrt(dispx[i] * dispx[i] + dispy[i] * dispy[i])
+        if d > 0.0:
+            s = min(d, temp) / d
+            xs[i] = min(xmax, max(xmin, xs[i] + dispx[i] * s))
+            ys[i] = min(ymax, max(ymin, ys[i] + dispy[i] * s))
+
+
+# One feed entry; a tuple keeps per-event overhead well below a dict
+Event = namedtuple("Event", "ts node msg tag")
+
+# Only a handful of distinct ports ever appear, so their id strings are
+# built (and interned) once rather than on every line.
+_NID_CACHE: dict[int, str] = {}
+_LABEL_CACHE: dict[tuple, str] = {}
+
+
+def _nid(port: int) -> str:
+    s = _NID_CACHE.get(port)
+    if s is None:
+        s = _NID_CACHE[port] = sys.intern(f"127.0.0.1:{port}")
+    return s
+
+
+def _node_label(ntype: str, port: int) -> str:
+    s = _LABEL_CACHE.get((ntype, port))
+    if s is None:
+        s = _LABEL_CACHE[(ntype, port)] = f"{ntype}:{port}"
+    return s
+
+
 class NetworkState:
     """Parses log lines and maintains the live state of the network."""
 
     def __init__(self):
         self.seeds: dict[str, dict] = {}       # id -> {status, port}
         self.peers: dict[str, dict] = {}       # id -> {status, port, gossip_count}
-        self.edges: set[tuple] = set()          # (a, b) undirected
-        self.events: list[dict] = []
+        self.adj: defaultdict[str, set[str]] = defaultdict(set)  # undirected adjacency
+        self.edge_count = 0
+        self.events: deque[Event] = deque(maxlen=MAX_EVENTS)
+        self.event_seq = 0                  # total events ever recorded
         self.gossip_total = 0
         self.consensus_ok = 0
         self.consensus_no = 0
         self.removals = 0
         self.dead_reports = 0
-        self._flash_edges: dict[tuple, float] = {}  # edge -> expire_ts
+        self.alive_peers = 0                # maintained incrementally for the
+        self.dead_peers = 0                 # stats panel (dead or removed)
+        self.total_gossip_generated = 0
+        self._flash_edges: dict[tuple, float] = {}  # edge -> monotonic expiry
+        self.dirty = False                  # set whenever anything drawable changes
 
     def _add_event(self, ts, ntype, port, level, msg, tag="info"):
-        self.events.append({
-            "ts": ts, "node": f"{ntype}:{port}",
-            "msg": msg, "tag": tag
-        })
-        if len(self.events) > MAX_EVENTS:
-            self.events = self.events[-MAX_EVENTS:]
-
-    def process_line(self, line: str):
-        m = LINE_RE.match(line.strip())
-        if not m:
+        self.dirty = True
+        self.events.append(Event(ts, _node_label(ntype, port), msg, tag))
+        self.event_seq += 1
+
+    def process_line(self, line: bytes):
+        fields = parse_line(line)
+        if not fields:
             return
-        ts    = m.group("ts")
-        ntype = m.group("ntype")
-        port  = int(m.group("port"))
-        level = m.group("level")
-        msg   = m.group("msg")
-        nid   = f"127.0.0.1:{port}"
+        ts, ntype, port, level, msg = fields
+        nid = _nid(port)
 
         # ── Track nodes ──────────────────────────────────────────────
         if ntype == "SEED" and nid not in self.seeds:
             self.seeds[nid] = {"port": port, "status": "alive"}
+            self.dirty = True
         if ntype == "PEER" and nid not in self.peers:
             self.peers[nid] = {"port": port, "status": "alive", "gossip": 0}
+            self.alive_peers += 1
+            self.dirty = True
 
-        # ── Consensus ────────────────────────────────────────────────
-        if "CONSENSUS OUTCOME" in msg:
-            if "APPROVED" in msg:
-                self.consensus_ok += 1
-                self._add_event(ts, ntype, port, level, msg, "consensus_ok")
-            else:
-                self.consensus_no += 1
-                self._add_event(ts, ntype, port, level, msg, "consensus_no")
-            return
-
-        # ── Registration ─────────────────────────────────────────────
-        if "PROPOSAL:" in msg and "Register" in msg:
-            self._add_event(ts, ntype, port, level, msg, "proposal")
-            return
-
-        # ── Overlay / neighbors ──────────────────────────────────────
-        if "Overlay built" in msg:
-            nm = re.search(r"neighbors=\[([^\]]*)\]", msg)
-            if nm:
-                nbrs = re.findall(r"['\"]?([\d.]+:\d+)['\"]?", nm.group(1))
-                for nb in nbrs:
-                    e = tuple(sorted([nid, nb]))
-                    self.edges.add(e)
-            self._add_event(ts, ntype, port, level, msg, "overlay")
-            return
-
-        # ── Gossip generated ─────────────────────────────────────────
-        if "Generated gossip" in msg:
-            self.gossip_total += 1
-            if nid in self.peers:
-                self.peers[nid]["gossip"] += 1
-            self._add_event(ts, ntype, port, level, msg, "gossip")
-            return
-
-        # ── Gossip received ──────────────────────────────────────────
-        if "Gossip received" in msg:
-            self.gossip_total += 1
-            fm = re.search(r"from=([\d.]+:\d+)", msg)
-            if fm:
-                src = fm.group(1)
-                e = tuple(sorted([nid, src]))
-                self._flash_edges[e] = datetime.now().timestamp() + 1.5
-            self._add_event(ts, ntype, port, level, msg, "gossip")
-            return
-
-        # ── Dead node report ─────────────────────────────────────────
-        if "DEAD NODE REPORT" in msg:
-            self.dead_reports += 1
-            dm = re.search(r"Dead Node:([\d.]+):(\d+)", msg)
-            if dm:
-                did = f"{dm.group(1)}:{dm.group(2)}"
-                if did in self.peers:
-                    self.peers[did]["status"] = "dead"
-            self._add_event(ts, ntype, port, level, msg, "dead")
-            return
-
-        # ── Confirmed removal ────────────────────────────────────────
-        if "CONFIRMED REMOVAL" in msg:
-            self.removals += 1
-            rm = re.search(r"CONFIRMED REMOVAL:\s*([\d.]+:\d+)", msg)
-            if rm:
-                rid = rm.group(1)
-                if rid in self.peers:
-                    self.peers[rid]["status"] = "removed"
-                # Remove edges involving this peer
-                self.edges = {e for e in self.edges if rid not in e}
-            self._add_event(ts, ntype, port, level, msg, "removal")
-            return
-
-        # ── Vote ─────────────────────────────────────────────────────
-        if "Vote from" in msg or "Voting" in msg:
-            self._add_event(ts, ntype, port, level, msg, "vote")
+        # ── Dispatch on the first event keyword in the message ───────
+        em = EVENT_RE.search(msg)
+        handler = self.DISPATCH.get(em.group(1)) if em else None
+        if handler and handler(self, ts, ntype, port, level, msg, nid):
             return
 
         # ── Other important events ───────────────────────────────────
@@ -175,9 +236,129 @@ class NetworkState:
                                        "Peer List", "fully active")):
             self._add_event(ts, ntype, port, level, msg, "info")
 
-    def is_flash(self, edge):
-        exp = self._flash_edges.get(edge, 0)
-        return datetime.now().timestamp() < exp
+    def _add_edge(self, a, b):
+        a, b = sys.intern(a), sys.intern(b)
+        if a == b or b in self.adj[a]:
+            return
+        self.adj[a].add(b)
+        self.adj[b].add(a)
+        self.edge_count += 1
+
+    def _drop_node_edges(self, nid):
+        nbrs = self.adj.pop(nid, ())
+        for nb in nbrs:
+            self.adj[nb].discard(nid)
+        self.edge_count -= len(nbrs)
+
+    def iter_edges(self):
+        """Yield each undirected edge once as a sorted (a, b) tuple."""
+        for a, nbrs in self.adj.items():
+            for b in nbrs:
+                if a < b:
+                    yield (a, b)
+
+    def _set_peer_status(self, pid, status):
+        info = self.peers[pid]
+        if info["status"] == "alive" and status != "alive":
+            self.alive_peers -= 1
+            self.dead_peers += 1
+        info["status"] = status
+
+    # ── Event handlers (return True when the line was consumed) ──────
+
+    def _h_consensus(self, ts, ntype, port, level, msg, nid):
+        if "APPROVED" in msg:
+            self.consensus_ok += 1
+            self._add_event(ts, ntype, port, level, msg, "consensus_ok")
+        else:
+            self.consensus_no += 1
+            self._add_event(ts, ntype, port, level, msg, "consensus_no")
+        return True
+
+    def _h_proposal(self, ts, ntype, port, level, msg, nid):
+        if "Register" not in msg:
+            return False
+        self._add_event(ts, ntype, port, level, msg, "proposal")
+        return True
+
+    def _h_overlay(self, ts, ntype, port, level, msg, nid):
+        nm = NEIGHBORS_RE.search(msg)
+        if nm:
+            nbrs = PEER_ADDR_RE.findall(nm.group(1))
+            for nb in nbrs:
+                self._add_edge(nid, nb)
+        self._add_event(ts, ntype, port, level, msg, "overlay")
+        return True
+
+    def _h_gossip_generated(self, ts, ntype, port, level, msg, nid):
+        self.gossip_total += 1
+        if nid in self.peers:
+            self.peers[nid]["gossip"] += 1
+            self.total_gossip_generated += 1
+        self._add_event(ts, ntype, port, level, msg, "gossip")
+        return True
+
+    def _h_gossip_received(self, ts, ntype, port, level, msg, nid):
+        self.gossip_total += 1
+        fm = GOSSIP_FROM_RE.search(msg)
+        if fm:
+            src = fm.group(1)
+            e = tuple(sorted([nid, src]))
+            self._flash_edges[e] = time.monotonic() + 1.5
+        self._add_event(ts, ntype, port, level, msg, "gossip")
+        return True
+
+    def _h_dead_report(self, ts, ntype, port, level, msg, nid):
+        self.dead_reports += 1
+        dm = DEAD_NODE_RE.search(msg)
+        if dm:
+            did = f"{dm.group(1)}:{dm.group(2)}"
+            if did in self.peers:
+                self._set_peer_status(did, "dead")
+        self._add_event(ts, ntype, port, level, msg, "dead")
+        return True
+
+    def _h_removal(self, ts, ntype, port, level, msg, nid):
+        self.removals += 1
+        rm = REMOVAL_RE.search(msg)
+        if rm:
+            rid = rm.group(1)
+            if rid in self.peers:
+                self._set_peer_status(rid, "removed")
+            # Remove edges involving this peer
+            self._drop_node_edges(rid)
+        self._add_event(ts, ntype, port, level, msg, "removal")
+        return True
+
+    def _h_vote(self, ts, ntype, port, level, msg, nid):
+        self._add_event(ts, ntype, port, level, msg, "vote")
+        return True
+
+    DISPATCH = {
+        "CONSENSUS OUTCOME": _h_consensus,
+        "PROPOSAL:":         _h_proposal,
+        "Overlay built":     _h_overlay,
+        "Generated gossip":  _h_gossip_generated,
+        "Gossip received":   _h_gossip_received,
+        "DEAD NODE REPORT":  _h_dead_report,
+        "CONFIRMED REMOVAL": _h_removal,
+        "Vote from":         _h_vote,
+        "Voting":            _h_vote,
+    }
+
+    def is_flash(self, edge, now):
+        return now < self._flash_edges.get(edge, 0)
+
+    def expire_flashes(self, now=None) -> bool:
+        """Forget flashes that have run out; True if any edge changed colour."""
+        if not self._flash_edges:
+            return False
+        if now is None:
+            now = time.monotonic()
+        expired = [e for e, exp in self._flash_edges.items() if exp <= now]
+        for e in expired:
+            del self._flash_edges[e]
+        return bool(expired)
 
 
 class GossipGUI:
@@ -186,7 +367,10 @@ class GossipGUI:
     def __init__(self, log_path: str):
         self.log_path = log_path
         self.state = NetworkState()
+        self._fh = None        # persistent handle on the log file
+        self._fh_ino = None    # inode of the open handle (detects rotation)
         self._file_pos = 0
+        self._partial = b""    # trailing line not yet terminated by '\n'
 
         # ── Root window ──────────────────────────────────────────────
         self.root = tk.Tk()
@@ -273,23 +457,83 @@ class GossipGUI:
             tk.Label(legend, text=label, fg=FG_DIM, bg=HEADER_BG,
                      font=("Consolas", 9)).pack(side=tk.LEFT, padx=(0,8))
 
-        self._last_feed_len = 0
+        self._last_feed_seq = 0
         self._node_positions = {}
 
+        # Canvas items are created once and patched in place on each redraw
+        self._node_items: dict[str, dict] = {}   # nid -> {shape, text, badge, badge_text}
+        self._node_prev: dict[str, tuple] = {}   # nid -> (x, y, fill, outline, gossip)
+        self._edge_items: dict[tuple, int] = {}  # flashing edge -> line item
+        self._edge_prev: dict[tuple, tuple] = {} # flashing edge -> (x1, y1, x2, y2)
+        self._edge_runs: list[int] = []          # one polyline per component
+        self._edge_runs_prev: list[list] = []
+        self._placeholder_items: list[int] = []
+        self._canvas_size = None
+        self._stats_lines = None
+
+        # Force layout state — positions persist between redraws so the
+        # graph settles smoothly instead of jumping each frame.
+        self._layout_xy: dict[str, tuple] = {}
+        self._layout_key = None
+        self._layout_temp = 0.0
+        self._layout_settling = False
+        # Unit-circle (cos, sin) pairs for the small-overlay ring, keyed by
+        # peer count; only the radius and centre vary with canvas size.
+        self._unit_circle: dict[int, list] = {}
+        # (numpy, jitted _fr_step) once loaded, False if unavailable
+        self._jit = None
+
     # ── Log tailing ──────────────────────────────────────────────────
 
+    def _open_log(self):
+        if self._fh:
+            self._fh.close()
+        self._fh = open(self.log_path, 'rb', buffering=65536)
+        self._fh_ino = os.fstat(self._fh.fileno()).st_ino
+        self._file_pos = 0
+        self._partial = b""
+
+    def _read_new_lines(self):
+        """Read lines appended since the last poll from the open handle."""
+        try:
+            st = os.stat(self.log_path)
+        except FileNotFoundError:
+            return
+        if self._fh is None or st.st_ino != self._fh_ino:
+            self._open_log()                     # first poll or log rotated
+        elif st.st_size == self._file_pos:
+            return                               # nothing appended since last poll
+        elif st.st_size < self._file_pos:
+            self._fh.seek(0)                     # truncated in place
+            self._file_pos = 0
+            self._partial = b""
+
+        fh = self._fh
+        while True:
+            line = fh.readline()
+            if not line:
+                break
+            if not line.endswith(b'\n'):
+                self._partial += line            # writer is mid-line
+                break
+            if self._partial:
+                line, self._partial = self._partial + line, b""
+            self.state.process_line(line)
+        self._file_pos = fh.tell()
+
     def _poll_log(self):
         try:
-            if os.path.exists(self.log_path):
-                with open(self.log_path, 'r') as f:
-                    f.seek(self._file_pos)
-                    new_lines = f.readlines()
-                    self._file_pos = f.tell()
-                for line in new_lines:
-                    self.state.process_line(line)
+            self._read_new_lines()
         except Exception:
             pass
-        self._redraw()
+        # Only redraw when something visible changed: new state, an edge
+        # flash running out, a force layout still settling, or a resize.
+        size = (self.canvas.winfo_width(), self.canvas.winfo_height())
+        if (self.state.expire_flashes() or self.state.dirty
+                or self._layout_settling or size != self._canvas_size):
+            self._canvas_size = size
+            self.state.dirty = False
+            self._redraw()
         self.root.after(POLL_MS, self._poll_log)
 
     # ── Drawing ──────────────────────────────────────────────────────
@@ -311,16 +555,22 @@ class GossipGUI:
             for i, sid in enumerate(seeds):
                 pos[sid] = (sx + i * spacing, 60)
 
-        # Living peers — circle
+        # Living peers — circle for small overlays, force layout beyond
         n = len(peers)
-        if n > 0:
+        if n >= FORCE_LAYOUT_MIN_PEERS:
+            pos.update(self._force_positions(peers, cw, ch))
+        elif n > 0:
+            self._layout_settling = False
             cx, cy = cw / 2, ch / 2 + 30
             r = min(cw, ch) * 0.32
-            for i, pid in enumerate(peers):
-                angle = -math.pi / 2 + 2 * math.pi * i / n
-                px = cx + r * math.cos(angle)
-                py = cy + r * math.sin(angle)
-                pos[pid] = (px, py)
+            unit = self._unit_circle.get(n)
+            if unit is None:
+                unit = self._unit_circle[n] = [
+                    (math.cos(a), math.sin(a))
+                    for a in (-math.pi / 2 + 2 * math.pi * i / n
+                              for i in range(n))]
+            for pid, (ux, uy) in zip(peers, unit):
+                pos[pid] = (cx + r * ux, cy + r * uy)
 
         # Dead/removed — small cluster bottom-right
         for i, pid in enumerate(dead_peers):
@@ -328,34 +578,92 @@ class GossipGUI:
 
         self._node_positions = pos
 
+    def _force_positions(self, peers, cw, ch):
+        """Advance the force-directed layout a few steps and return positions."""
+        index = {pid: i for i, pid in enumerate(peers)}
+        adj = [[] for _ in peers]
+        for (a, b) in self.state.iter_edges():
+            ia, ib = index.get(a), index.get(b)
+            if ia is not None and ib is not None:
+                adj[ia].append(ib)
+                adj[ib].append(ia)
+        indptr, indices = [0], []
+        for nbrs in adj:
+            indices.extend(nbrs)
+            indptr.append(len(indices))
+
+        xmin, xmax, ymin, ymax = 40.0, cw - 40.0, 110.0, ch - 40.0
+        key = (tuple(peers), len(indices), cw, ch)
+        if key != self._layout_key:
+            # Topology or canvas changed — reheat, starting new nodes on the circle
+            self._layout_key = key
+            self._layout_temp = min(cw, ch) / 10
+            cx, cy = cw / 2, ch / 2 + 30
+            r = min(cw, ch) * 0.32
+            n = len(peers)
+            for i, pid in enumerate(peers):
+                if pid not in self._layout_xy:
+                    angle = -math.pi / 2 + 2 * math.pi * i / n
+                    self._layout_xy[pid] = (cx + r * math.cos(angle),
+                                            cy + r * math.sin(angle))
+
+        xs = [self._layout_xy[p][0] for p in peers]
+        ys = [self._layout_xy[p][1] for p in peers]
+        jit = self._load_jit() if len(peers) >= LARGE_N_THRESHOLD else None
+        if jit:
+            np, step = jit
+            xs, ys = np.array(xs), np.array(ys)
+            dispx, dispy = np.zeros(len(peers)), np.zeros(len(peers))
+            indptr = np.array(indptr, dtype=np.int32)
+            indices = np.array(indices, dtype=np.int32)
+            steps = JIT_STEPS_PER_REDRAW
+        else:
+            step = _fr_step
+            dispx, dispy = [0.0] * len(peers), [0.0] * len(peers)
+            steps = FORCE_STEPS_PER_REDRAW
+
+        k = 0.8 * math.sqrt((xmax - xmin) * (ymax - ymin) / len(peers))
+        for _ in range(steps):
+            if self._layout_temp < 0.5:
+                break
+            step(xs, ys, dispx, dispy, indptr, indices, k,
+                     self._layout_temp, xmin, xmax, ymin, ymax)
+            self._layout_temp *= 0.9
+        self._layout_settling = self._layout_temp >= 0.5
+
+        self._layout_xy = {pid: (float(xs[i]), float(ys[i]))
+                           for i, pid in enumerate(peers)}
+        return dict(self._layout_xy)
+
+    def _load_jit(self):
+        """Import numpy/numba on first use and compile the layout kernel."""
+        global prange
+        if self._jit is None:
+            self._jit = False
+            if USE_JIT:
+                try:
+                    import numpy as np
+                    import numba
+                except ImportError:
+                    return False
+                prange = numba.prange     # marks the outer loop as parallel
+                self._jit = (np, numba.njit(parallel=True, fastmath=True,
+                                            cache=True)(_fr_step))
+        return self._jit
+
     def _redraw(self):
         c = self.canvas
-        c.delete("all")
         self._compute_positions()
         pos = self._node_positions
 
-        # ── Edges ────────────────────────────────────────────────────
-        for (a, b) in self.state.edges:
-            if a in pos and b in pos:
-                x1, y1 = pos[a]
-                x2, y2 = pos[b]
-                if self.state.is_flash((a, b)) or self.state.is_flash(tuple(sorted([a, b]))):
-                    color, width = GOSSIP_FLASH, 2.5
-                else:
-                    color, width = EDGE_COLOR, 1
-                c.create_line(x1, y1, x2, y2, fill=color, width=width)
+        self._sync_edges(pos, time.monotonic())
 
         # ── Seed nodes ───────────────────────────────────────────────
-        r = 22
         for sid, info in self.state.seeds.items():
-            if sid not in pos:
-                continue
-            x, y = pos[sid]
-            # Diamond shape for seeds
-            pts = [x, y-r, x+r, y, x, y+r, x-r, y]
-            c.create_polygon(pts, fill=SEED_COLOR, outline=SEED_OUTLINE, width=2)
-            c.create_text(x, y, text=f"S\n{info['port']}", fill="#1e1e2e",
-                          font=("Consolas", 8, "bold"), justify=tk.CENTER)
+            if sid in pos:
+                x, y = pos[sid]
+                self._sync_node(sid, "seed", info, x, y,
+                                SEED_COLOR, SEED_OUTLINE, 0)
 
         # ── Peer nodes ───────────────────────────────────────────────
         for pid, info in self.state.peers.items():
@@ -368,29 +676,33 @@ class GossipGUI:
                 fill, outline = "#45475a", "#585b70"
             else:
                 fill, outline = PEER_COLOR, PEER_OUTLINE
-            c.create_oval(x-r, y-r, x+r, y+r, fill=fill, outline=outline, width=2)
-            label = f"P\n{info['port']}"
-            c.create_text(x, y, text=label, fill="#1e1e2e",
-                          font=("Consolas", 8, "bold"), justify=tk.CENTER)
-            # Gossip count badge
-            gc = info.get("gossip", 0)
-            if gc > 0:
-                bx, by = x + r - 2, y - r + 2
-                c.create_oval(bx-8, by-8, bx+8, by+8,
-                              fill=GOSSIP_FLASH, outline="")
-                c.create_text(bx, by, text=str(gc), fill="#1e1e2e",
-                              font=("Consolas", 7, "bold"))
+            self._sync_node(pid, "peer", info, x, y,
+                            fill, outline, info.get("gossip", 0))
+
+        # Drop items for nodes that no longer have a position
+        for nid in [n for n in self._node_items if n not in pos]:
+            for item in self._node_items.pop(nid).values():
+                if item:
+                    c.delete(item)
+            self._node_prev.pop(nid, None)
 
         # ── "No data" placeholder ────────────────────────────────────
         if not self.state.seeds and not self.state.peers:
             cw = c.winfo_width() or 700
             ch = c.winfo_height() or 500
-            c.create_text(cw/2, ch/2 - 10,
-                          text="Waiting for network data…",
-                          fill=FG_DIM, font=("Consolas", 14))
-            c.create_text(cw/2, ch/2 + 15,
-                          text="Start with:  ./launch_network.sh gui",
-                          fill=FG_DIM, font=("Consolas", 10))
+            if not self._placeholder_items:
+                self._placeholder_items = [
+                    c.create_text(0, 0, text="Waiting for network data…",
+                                  fill=FG_DIM, font=("Consolas", 14)),
+                    c.create_text(0, 0, text="Start with:  ./launch_network.sh gui",
+                                  fill=FG_DIM, font=("Consolas", 10)),
+                ]
+            c.coords(self._placeholder_items[0], cw/2, ch/2 - 10)
+            c.coords(self._placeholder_items[1], cw/2, ch/2 + 15)
+        elif self._placeholder_items:
+            for item in self._placeholder_items:
+                c.delete(item)
+            self._placeholder_items = []
 
         # ── Stats panel ──────────────────────────────────────────────
         self._update_stats()
@@ -398,19 +710,150 @@ class GossipGUI:
         # ── Event feed ───────────────────────────────────────────────
         self._update_feed()
 
+    def _sync_edges(self, pos, now):
+        """
+        Bring the edge lines in line with the current edge set.
+
+        Flashing edges keep one line item each.  All other edges are drawn
+        as one polyline per connected component: a depth-first walk that
+        retraces its steps covers every edge with a single create_line
+        (the retraced segments overlap exactly, so they look the same).
+        """
+        c = self.canvas
+        flashing = set()
+        normal = defaultdict(list)
+        for (a, b) in self.state.iter_edges():
+            if a not in pos or b not in pos:
+                continue
+            if self.state.is_flash((a, b), now):
+                flashing.add((a, b))
+            else:
+                normal[a].append(b)
+                normal[b].append(a)
+
+        # ── Gossip-flashed edges: individual items ───────────────────
+        for e in flashing:
+            (x1, y1), (x2, y2) = pos[e[0]], pos[e[1]]
+            cur = (x1, y1, x2, y2)
+            item = self._edge_items.get(e)
+            if item is None:
+                item = c.create_line(*cur, fill=GOSSIP_FLASH, width=2.5)
+                c.tag_lower(item)                # keep edges below nodes
+                self._edge_items[e] = item
+            elif self._edge_prev[e] != cur:
+                c.coords(item, *cur)
+            self._edge_prev[e] = cur
+        for e in [e for e in self._edge_items if e not in flashing]:
+            c.delete(self._edge_items.pop(e))
+            self._edge_prev.pop(e, None)
+
+        # ── Everything else: one walk per component ──────────────────
+        walks = []
+        visited, used = set(), set()
+        for root in normal:
+            if root in visited:
+                continue
+            visited.add(root)
+            walk = list(pos[root])
+            stack = [(root, iter(normal[root]))]
+            while stack:
+                u, nbrs = stack[-1]
+                for v in nbrs:
+                    e = (u, v) if u < v else (v, u)
+                    if e in used:
+                        continue
+                    used.add(e)
+                    walk.extend(pos[v])
+                    if v in visited:
+                        walk.extend(pos[u])      # closes a cycle: step back
+                    else:
+                        visited.add(v)
+                        stack.append((v, iter(normal[v])))
+                    break
+                else:
+                    stack.pop()
+                    if stack:
+                        walk.extend(pos[stack[-1][0]])   # retrace to parent
+            walks.append(walk)
+
+        for i, walk in enumerate(walks):
+            if i < len(self._edge_runs):
+                if self._edge_runs_prev[i] != walk:
+                    c.coords(self._edge_runs[i], *walk)
+                    self._edge_runs_prev[i] = walk
+            else:
+                item = c.create_line(*walk, fill=EDGE_COLOR, width=1)
+                c.tag_lower(item)
+                self._edge_runs.append(item)
+                self._edge_runs_prev.append(walk)
+        for item in self._edge_runs[len(walks):]:
+            c.delete(item)
+        del self._edge_runs[len(walks):]
+        del self._edge_runs_prev[len(walks):]
+
+    def _sync_node(self, nid, kind, info, x, y, fill, outline, gossip):
+        """Create a node's items on first sight, then patch only what changed."""
+        c = self.canvas
+        r = 22
+        items = self._node_items.get(nid)
+        prev = self._node_prev.get(nid)
+        if items is None:
+            if kind == "seed":
+                # Diamond shape for seeds
+                shape = c.create_polygon(x, y-r, x+r, y, x, y+r, x-r, y,
+                                         fill=fill, outline=outline, width=2)
+                label = f"S\n{info['port']}"
+            else:
+                shape = c.create_oval(x-r, y-r, x+r, y+r,
+                                      fill=fill, outline=outline, width=2)
+                label = f"P\n{info['port']}"
+            text = c.create_text(x, y, text=label, fill="#1e1e2e",
+                                 font=("Consolas", 8, "bold"), justify=tk.CENTER)
+            items = {"shape": shape, "text": text, "badge": None, "badge_text": None}
+            self._node_items[nid] = items
+        else:
+            if prev[:2] != (x, y):
+                if kind == "seed":
+                    c.coords(items["shape"], x, y-r, x+r, y, x, y+r, x-r, y)
+                else:
+                    c.coords(items["shape"], x-r, y-r, x+r, y+r)
+                c.coords(items["text"], x, y)
+            if prev[2:4] != (fill, outline):
+                c.itemconfigure(items["shape"], fill=fill, outline=outline)
+
+        # Gossip count badge
+        if gossip > 0:
+            bx, by = x + r - 2, y - r + 2
+            if items["badge"] is None:
+                items["badge"] = c.create_oval(bx-8, by-8, bx+8, by+8,
+                                               fill=GOSSIP_FLASH, outline="")
+                items["badge_text"] = c.create_text(bx, by, text=str(gossip),
+                                                    fill="#1e1e2e",
+                                                    font=("Consolas", 7, "bold"))
+            else:
+                if prev[:2] != (x, y):
+                    c.coords(items["badge"], bx-8, by-8, bx+8, by+8)
+                    c.coords(items["badge_text"], bx, by)
+                if prev[4] != gossip:
+                    c.itemconfigure(items["badge_text"], text=str(gossip))
+        self._node_prev[nid] = (x, y, fill, outline, gossip)
+
     def _update_stats(self):
         s = self.state
-        alive = sum(1 for p in s.peers.values() if p["status"] == "alive")
-        dead  = sum(1 for p in s.peers.values() if p["status"] in ("dead", "removed"))
-        total_gossip_gen = sum(p.get("gossip", 0) for p in s.peers.values())
+        alive = s.alive_peers
+        dead  = s.dead_peers
+        total_gossip_gen = s.total_gossip_generated
 
         lines = [
             f"  Seeds:  {len(s.seeds)}          Peers:  {alive} alive / {dead} dead",
-            f"  Edges:  {len(s.edges)}          Gossip events:  {s.gossip_total}",
+            f"  Edges:  {s.edge_count}          Gossip events:  {s.gossip_total}",
             f"  Consensus:  ✓ {s.consensus_ok}  approved   ✗ {s.consensus_no}  rejected",
             f"  Dead reports:  {s.dead_reports}      Removals:  {s.removals}",
             f"  Gossip generated:  {total_gossip_gen}  /  {alive * 10} max",
         ]
+        if lines == self._stats_lines:
+            return
+        self._stats_lines = lines
         self.stats_text.config(state=tk.NORMAL)
         self.stats_text.delete("1.0", tk.END)
         self.stats_text.insert(tk.END, "\n".join(lines))
@@ -418,18 +861,22 @@ class GossipGUI:
 
     def _update_feed(self):
         evts = self.state.events
-        if len(evts) == self._last_feed_len:
+        fresh = self.state.event_seq - self._last_feed_seq
+        if not fresh:
             return
-        new_events = evts[self._last_feed_len:]
-        self._last_feed_len = len(evts)
+        self._last_feed_seq = self.state.event_seq
+        # Events that fell off the deque before we got here are skipped
+        new_events = islice(evts, max(0, len(evts) - fresh), None)
 
-        self.feed_text.config(state=tk.NORMAL)
+        # One insert with alternating text/tag pairs instead of three per event
+        args = []
         for ev in new_events:
-            ts_str = f"[{ev['ts']}] "
-            node_str = f"[{ev['node']}] "
-            self.feed_text.insert(tk.END, ts_str, "ts")
-            self.feed_text.insert(tk.END, node_str, ev["tag"])
-            self.feed_text.insert(tk.END, ev["msg"] + "\n", ev["tag"])
+            args.extend((f"[{ev.ts}] ", "ts",
+                         f"[{ev.node}] ", ev.tag,
+                         ev.msg + "\n", ev.tag))
+        self.feed_text.config(state=tk.NORMAL)
+        self.feed_text.insert(tk.END, *args)
+        self.feed_text.delete("1.0", f"end - {MAX_FEED_LINES} lines")
         self.feed_text.see(tk.END)
         self.feed_text.config(state=tk.DISABLED)
 
@@ -5,9 +5,9 @@ Provides structured, colored console logging AND writes all significant
 events to the shared outputfile.txt as required by the assignment spec.
 """
 
-import copy
 import logging
 import os
+import queue
 import re
 import sys
 import threading
@@ -28,6 +28,12 @@ ROOT_OUTPUT_FILE = os.path.join(SCRIPT_DIR, "outputfile.txt")
 # Thread-safe lock for writing to the shared output files
 _output_lock = threading.Lock()
 
+# Opt-in background appender for very chatty runs (see AsyncOutputFileHandler)
+ASYNC_LOG = os.environ.get("GOSSIP_ASYNC_LOG", "") == "1"
+
+# Opt-in: color the whole console line by level, not just the message
+COLOR_WHOLE_LINE = os.environ.get("GOSSIP_COLOR_LINE", "") == "1"
+
 
 # ─── Colors for terminal output ──────────────────────────────────────────────
 COLORS = {
@@ -51,13 +57,35 @@ class ColorFormatter(logging.Formatter):
         logging.ERROR:    COLORS['RED'],
         logging.CRITICAL: COLORS['MAGENTA'],
     }
+    DEFAULT_COLOR = COLORS['WHITE']
+    RESET = COLORS['RESET']
+
+    def __init__(self, fmt=None, datefmt=None, *, use_color: bool = None,
+                 whole_line: bool = None):
+        super().__init__(fmt, datefmt)
+        # Default: color only when the console is a terminal, not a pipe/file
+        self.use_color = sys.stdout.isatty() if use_color is None else use_color
+        self.whole_line = COLOR_WHOLE_LINE if whole_line is None else whole_line
+        # One formatter per level with the message field pre-wrapped in its
+        # color, so records are neither copied nor modified.
+        fmt = fmt or '%(message)s'
+        self._level_fmts = {
+            lvl: logging.Formatter(
+                fmt.replace('%(message)s', f"{c}%(message)s{self.RESET}"),
+                datefmt)
+            for lvl, c in self.LEVEL_COLORS.items()
+        }
+        self._default_fmt = logging.Formatter(
+            fmt.replace('%(message)s', f"{self.DEFAULT_COLOR}%(message)s{self.RESET}"),
+            datefmt)
 
     def format(self, record):
-        rec = copy.copy(record)
-        color = self.LEVEL_COLORS.get(rec.levelno, COLORS['WHITE'])
-        reset = COLORS['RESET']
-        rec.msg = f"{color}{rec.msg}{reset}"
-        return super().format(rec)
+        if not self.use_color:
+            return super().format(record)
+        if self.whole_line:
+            return "%s%s%s" % (self.LEVEL_COLORS.get(record.levelno, self.DEFAULT_COLOR),
+                               super().format(record), self.RESET)
+        return self._level_fmts.get(record.levelno, self._default_fmt).format(record)
 
 
 class OutputFileHandler(logging.Handler):
@@ -65,22 +93,84 @@ class OutputFileHandler(logging.Handler):
     Handler that appends every INFO-or-above message to the shared
     outputfile.txt.  Uses a process-wide lock so multiple threads
     within the same process cannot interleave writes.
+
+    The files are opened once and kept open.  They are line-buffered, so
+    each record reaches the file as one whole-line append.  This matters
+    because other processes share the file and the GUI tails it live.
     """
 
     def __init__(self, *filepaths: str):
         super().__init__(level=logging.INFO)
         self._filepaths = filepaths
+        self._files = [open(fp, 'a', buffering=1) for fp in filepaths]
+
+    def write_line(self, text: str):
+        """Append one raw line (no formatting) to every output file."""
+        data = text + '\n'
+        with _output_lock:
+            for f in self._files:
+                f.write(data)
 
     def emit(self, record):
         try:
-            msg = self.format(record)
-            with _output_lock:
-                for fp in self._filepaths:
-                    with open(fp, 'a') as f:
-                        f.write(msg + '\n')
+            self.write_line(self.format(record))
         except Exception:
             self.handleError(record)
 
+    def close(self):
+        with _output_lock:
+            for f in self._files:
+                try:
+                    f.close()
+                except OSError:
+                    pass
+            self._files = []
+        super().close()
+
+
+class AsyncOutputFileHandler(OutputFileHandler):
+    """
+    OutputFileHandler that hands lines to a writer thread.  emit() only
+    enqueues; the writer drains everything queued since its last pass
+    and appends it to each file in a single write, so a burst of records
+    costs one syscall per file instead of one per record.
+
+    Lines still queued when the process is killed outright are lost,
+    which is why this is opt-in (GOSSIP_ASYNC_LOG=1).
+    """
+
+    def __init__(self, *filepaths: str):
+        super().__init__(*filepaths)
+        self._queue = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._drain, daemon=True,
+                                        name="log-writer")
+        self._writer.start()
+
+    def write_line(self, text: str):
+        self._queue.put(text + '\n')
+
+    def _drain(self):
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = None in batch
+            data = ''.join(b for b in batch if b is not None)
+            with _output_lock:
+                for f in self._files:
+                    f.write(data)
+            if stop:
+                return
+
+    def close(self):
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join(timeout=2.0)
+        super().close()
+
 
 def get_logger(name: str, node_type: str = "node", port: int = 0) -> logging.Logger:
     """
@@ -103,13 +193,14 @@ def get_logger(name: str, node_type: str = "node", port: int = 0) -> logging.Log
     fmt_str = f'[%(asctime)s] [{node_type.upper()}:{port}] %(levelname)s - %(message)s'
     datefmt = '%Y-%m-%d %H:%M:%S'
 
-    # ── Console handler (colored) ─────────────────────────────────────────
+    # ── Console handler (colored when attached to a terminal) ─────────────
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(ColorFormatter(fmt=fmt_str, datefmt=datefmt))
 
     # ── Shared file handler (writes to both logs/ and root outputfile.txt) ─
-    output_handler = OutputFileHandler(OUTPUT_FILE, ROOT_OUTPUT_FILE)
+    handler_cls = AsyncOutputFileHandler if ASYNC_LOG else OutputFileHandler
+    output_handler = handler_cls(OUTPUT_FILE, ROOT_OUTPUT_FILE)
     output_handler.setFormatter(logging.Formatter(fmt=fmt_str, datefmt=datefmt))
 
     logger.addHandler(console_handler)
@@ -123,9 +214,6 @@ def get_logger(name: str, node_type: str = "node", port: int = 0) -> logging.Log
         f"  Node: {node_type.upper()}:{port}\n"
         f"{'='*60}"
     )
-    with _output_lock:
-        for fp in (OUTPUT_FILE, ROOT_OUTPUT_FILE):
-            with open(fp, 'a') as f:
-                f.write(banner + '\n')
+    output_handler.write_line(banner)
 
     return logger
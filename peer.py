@@ -19,28 +19,240 @@ Usage:
 """
 
 import argparse
+import heapq
+import itertools
 import math
 import os
 import random
+import selectors
 import socket
 import threading
 import time
+import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
 
 from protocol import (
-    MSG_DELIMITER,
     MSG_REGISTER_REQUEST, MSG_REGISTER_ACK, MSG_REGISTER_NACK,
     MSG_GET_PEER_LIST, MSG_PEER_LIST,
     MSG_DEAD_NODE_REPORT, MSG_GOSSIP,
     MSG_PING, MSG_PONG,
     MSG_SUSPECT_QUERY, MSG_SUSPECT_RESPONSE,
-    MAX_GOSSIP_MESSAGES, GOSSIP_INTERVAL,
-    make_message, parse_messages,
+    MAX_GOSSIP_MESSAGES, GOSSIP_INTERVAL, BloomFilter,
+    make_message, parse_messages, FrameError,
     peer_id, parse_peer_id,
     gossip_message_id, hash_message,
     dead_node_message, load_config
 )
 from logger import get_logger
 
+_NS_PER_SEC = 1_000_000_000
+
+IDLE_CONN_TIMEOUT = 10.0      # Close inbound streams silent for this long (s)
+MSG_SHARDS        = 16        # Dedup table shards (power of two)
+IHAVE_MAX         = 32        # Peer ids piggybacked on a GOSSIP frame
+OUTBUF_MAX        = 1 << 20   # Close inbound streams with more unsent replies
+
+
+class PeerConn:
+    """Per-connection state held by the runtime's selector."""
+    __slots__ = ("node", "addr", "buf", "out", "last_seen")
+
+    def __init__(self, node, addr):
+        self.node      = node
+        self.addr      = addr
+        self.buf       = bytearray()
+        self.out       = bytearray()      # reply bytes the socket refused
+        self.last_seen = time.monotonic_ns()
+
+
+class PeerRuntime:
+    """
+    Reactor and worker pools shared by every PeerNode in the process.
+
+    One selector thread serves all listeners and inbound streams and fires
+    timers.  Periodic jobs and blocking handlers run on `pool`; leaf network
+    probes run on `probes`, so a job waiting on probes never starves them.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get(cls) -> "PeerRuntime":
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def __init__(self):
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        self.pool   = ThreadPoolExecutor(max_workers=workers,
+                                         thread_name_prefix="peer-worker")
+        self.probes = ThreadPoolExecutor(max_workers=workers,
+                                         thread_name_prefix="peer-probe")
+        self._sel    = selectors.DefaultSelector()
+        self._timers = []                 # heap of (due_ns, seq, fn)
+        self._seq    = itertools.count()
+        self._calls  = deque()            # (fn, args) queued by other threads
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._sel.register(self._wake_r, selectors.EVENT_READ, self)
+        threading.Thread(target=self._run, name="peer-reactor",
+                         daemon=True).start()
+
+    # ── Scheduling (callable from any thread) ─────────────────────────────
+
+    def call_soon(self, fn, *args):
+        """Run fn(*args) on the reactor thread; fn must not block."""
+        self._calls.append((fn, args))
+        try:
+            self._wake_w.send(b'\0')
+        except OSError:
+            pass                          # wake-up already pending
+
+    def call_later(self, delay, fn):
+        due = time.monotonic_ns() + int(delay * _NS_PER_SEC)
+        self.call_soon(self._push_timer, due, fn)
+
+    def schedule_every(self, interval, fn, delay=0.0):
+        """
+        Run fn on the worker pool after `delay` s, then `interval` s after
+        each run returns, until it returns False or raises.
+        """
+        def run():
+            try:
+                again = fn() is not False
+            except Exception:
+                traceback.print_exc()
+                again = False
+            if again:
+                self.call_later(interval, submit)
+
+        def submit():
+            self.pool.submit(run)
+
+        self.call_later(delay, submit)
+
+    def add_listener(self, node):
+        self.call_soon(self._sel.register, node.server_socket,
+                       selectors.EVENT_READ, node)
+
+    def drop_node(self, node):
+        """Unregister and close node's listener and inbound streams."""
+        self.call_soon(self._drop_node, node)
+
+    def reply_soon(self, conn, data):
+        """Reply on an inbound stream from another thread."""
+        self.call_soon(self.reply, conn, data)
+
+    # ── Reactor thread ────────────────────────────────────────────────────
+
+    def reply(self, conn, data):
+        """
+        Write data on an inbound stream without blocking: whatever the
+        socket does not take now waits in the connection's out buffer and
+        is flushed when the selector reports it writable.
+        """
+        try:
+            st = self._sel.get_key(conn).data
+        except (KeyError, ValueError):
+            return                        # stream already closed
+        if not st.out:
+            try:
+                n = conn.send(data)
+            except (BlockingIOError, InterruptedError):
+                n = 0
+            except OSError:
+                PeerNode._close_conn(self._sel, conn)
+                return
+            if n == len(data):
+                return
+            data = memoryview(data)[n:]
+            self._sel.modify(conn, selectors.EVENT_READ | selectors.EVENT_WRITE,
+                             st)
+        st.out += data
+        if len(st.out) > OUTBUF_MAX:      # the client has stopped reading
+            PeerNode._close_conn(self._sel, conn)
+
+    def _flush(self, conn, st) -> bool:
+        """Send queued reply bytes; False if the stream was closed."""
+        try:
+            n = conn.send(st.out)
+        except (BlockingIOError, InterruptedError):
+            return True
+        except OSError:
+            PeerNode._close_conn(self._sel, conn)
+            return False
+        del st.out[:n]
+        if not st.out:
+            self._sel.modify(conn, selectors.EVENT_READ, st)
+        return True
+
+    def _push_timer(self, due, fn):
+        heapq.heappush(self._timers, (due, next(self._seq), fn))
+
+    def _drop_node(self, node):
+        for key in list(self._sel.get_map().values()):
+            d = key.data
+            if d is node or (isinstance(d, PeerConn) and d.node is node):
+                self._sel.unregister(key.fileobj)
+                key.fileobj.close()
+
+    def _run(self):
+        idle_ns = int(IDLE_CONN_TIMEOUT * _NS_PER_SEC)
+        next_sweep = time.monotonic_ns() + idle_ns
+        while True:
+            timeout = 1.0
+            if self._timers:
+                wait_ns = self._timers[0][0] - time.monotonic_ns()
+                timeout = max(0.0, min(timeout, wait_ns / _NS_PER_SEC))
+            for key, mask in self._sel.select(timeout):
+                d = key.data
+                try:
+                    if d is self:
+                        self._wake_r.recv(4096)
+                    elif isinstance(d, PeerConn):
+                        if (mask & selectors.EVENT_WRITE
+                                and not self._flush(key.fileobj, d)):
+                            continue
+                        if mask & selectors.EVENT_READ:
+                            d.node._read_conn(self._sel, key.fileobj, d)
+                    else:
+                        d._accept(self._sel)
+                except Exception:
+                    traceback.print_exc()
+            while self._calls:
+                fn, args = self._calls.popleft()
+                try:
+                    fn(*args)
+                except Exception:
+                    traceback.print_exc()
+            now = time.monotonic_ns()
+            while self._timers and self._timers[0][0] <= now:
+                _, _, fn = heapq.heappop(self._timers)
+                try:
+                    fn()
+                except Exception:
+                    traceback.print_exc()
+            if now >= next_sweep:
+                next_sweep = now + idle_ns
+                for key in list(self._sel.get_map().values()):
+                    d = key.data
+                    if isinstance(d, PeerConn) and now - d.last_seen > idle_ns:
+                        PeerNode._close_conn(self._sel, key.fileobj)
+
+
+class MessageShard:
+    """One slice of the gossip dedup table, with its own lock and filter."""
+    __slots__ = ("table", "lock", "seen")
+
+    def __init__(self):
+        self.table = {}                                  # {msg_hash: info}
+        self.lock  = threading.Lock()
+        self.seen  = BloomFilter(m_bits=(1 << 20) // MSG_SHARDS)
+
 
 class PeerNode:
     """
@@ -72,25 +284,65 @@ class PeerNode:
         # ── Overlay State ─────────────────────────────────────────────────
         self.neighbors      = {}          # {peer_id: {"host", "port"}}
         self.neighbors_lock = threading.Lock()
+        # Immutable copy of neighbors.items() for lock-free readers; writers
+        # republish it under neighbors_lock after every change.
+        self._neighbors_snapshot = ()
+        self._neighbor_ids = frozenset()  # its peer ids, republished with it
         self.known_peers      = {}        # All peers from seed lists
         self.known_peers_lock = threading.Lock()
 
         # ── Gossip State ──────────────────────────────────────────────────
-        self.message_list      = {}       # {msg_hash: info}  — dedup
-        self.message_list_lock = threading.Lock()
+        # Dedup table split by hash so concurrent inserts rarely contend
+        self._msg_shards = [MessageShard() for _ in range(MSG_SHARDS)]
         self.msg_counter      = 0
         self.msg_counter_lock = threading.Lock()
+        # Wall-clock stamp for receive logs, reformatted once per second;
+        # one tuple so readers never see a second paired with another's text
+        self._cached_ts = (-1, "")
 
         # ── Liveness State ────────────────────────────────────────────────
-        self.ping_responses    = {}       # {peer_id: last_pong_time}
+        self.ping_responses    = {}       # {peer_id: last_pong monotonic_ns}
         self.ping_lock         = threading.Lock()
         self.suspicion_counts  = {}       # {peer_id: miss_count}
         self.suspected_nodes   = set()
         self.suspected_lock    = threading.Lock()
+        # Liveness frames never change — receivers only read the sender,
+        # and round-trip timing is measured locally — so encode them once.
+        self._ping_bytes = make_message(MSG_PING, {"sender": self.my_id})
+        self._pong_bytes = make_message(MSG_PONG, {"sender": self.my_id})
+
+        # ── Outbound connection pool ──────────────────────────────────────
+        # One long-lived TCP stream per neighbor, reused for ping, gossip
+        # and suspect queries.  Each entry has its own lock so a slow
+        # request to one neighbor never holds up traffic to another.
+        self._conn_pool      = {}         # {peer_id: [socket, recv_buf]}
+        self._conn_locks     = {}         # {peer_id: Lock}
+        self._conn_pool_lock = threading.Lock()
+        # One-way frames waiting for a busy stream; whoever holds the
+        # stream's lock writes them all in one gathered send.
+        self._outq           = {}         # {peer_id: [frame, ...]}
 
         # ── Server ────────────────────────────────────────────────────────
+        # Inbound sockets are served by the process-wide reactor.  Handlers
+        # that make outbound calls of their own run on its worker pool, and
+        # outbound probes (pings, suspect queries, seed reports) fan out on
+        # its probe pool so one unresponsive neighbor costs one timeout.
+        self._runtime      = PeerRuntime.get()
+        self._handler_pool = self._runtime.pool
+        self._probe_pool   = self._runtime.probes
         self.server_socket = None
         self.running       = False
+        self._stopped      = threading.Event()   # wakes a blocking start()
+        # Inbound message type → handler(payload, conn, addr).
+        # SUSPECT_RESPONSE is read inline by the querying request.
+        self._handlers = {
+            MSG_GOSSIP:        lambda p, c, a: self._on_gossip(p, a),
+            MSG_PING:          lambda p, c, a: self._on_ping(p, c),
+            MSG_PONG:          lambda p, c, a: self._on_pong(p),
+            # Probes the suspect — keep it off the listener loop
+            MSG_SUSPECT_QUERY: lambda p, c, a: self._handler_pool.submit(
+                                   self._on_suspect_query, p, c),
+        }
         self.registered    = False
 
         self.logger.info(f"Peer node initialized at {self.my_id}")
@@ -99,16 +351,17 @@ class PeerNode:
     # Lifecycle
     # ═════════════════════════════════════════════════════════════════════════
 
-    def start(self):
+    def start(self, block: bool = True):
+        """Join the network; with block=False, return once active."""
         self.running = True
 
         # TCP listener
         self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self.server_socket.settimeout(1.0)
+        self.server_socket.setblocking(False)
         self.server_socket.bind((self.host, self.port))
-        self.server_socket.listen(50)
-        threading.Thread(target=self._listen_loop, daemon=True).start()
+        self.server_socket.listen(socket.SOMAXCONN)
+        self._runtime.add_listener(self)
         self.logger.info(f"Listening on {self.host}:{self.port}")
 
         # Step 1  Register with seeds
@@ -123,97 +376,242 @@ class PeerNode:
         # Step 3  Build power-law overlay
         self._build_overlay()
 
-        # Step 4  Gossip generator thread
-        threading.Thread(target=self._gossip_loop, daemon=True).start()
+        # Step 4  Gossip generator (first burst once the overlay settles)
+        self._runtime.schedule_every(self.gossip_interval, self._gossip_tick,
+                                     delay=2)
 
-        # Step 5  Liveness detector thread
-        threading.Thread(target=self._liveness_loop, daemon=True).start()
+        # Step 5  Liveness detector
+        self._runtime.schedule_every(self.ping_interval, self._liveness_tick,
+                                     delay=5)
 
         self.logger.info("Peer node fully active — gossip & liveness running")
 
+        if not block:
+            return
         try:
-            while self.running:
-                time.sleep(0.5)
+            self._stopped.wait()
         except KeyboardInterrupt:
             self.logger.info("Shutting down peer node…")
             self.stop()
 
     def stop(self):
         self.running = False
+        self._stopped.set()
         if self.server_socket:
-            self.server_socket.close()
+            self._runtime.drop_node(self)       # closes the listener too
+        with self._conn_pool_lock:
+            for pid in list(self._conn_pool):
+                self._evict_conn(pid)
         self.logger.info("Peer node stopped.")
 
     # ═════════════════════════════════════════════════════════════════════════
     # Network Layer
     # ═════════════════════════════════════════════════════════════════════════
 
-    def _listen_loop(self):
-        while self.running:
-            try:
-                conn, addr = self.server_socket.accept()
-                threading.Thread(
-                    target=self._handle_connection,
-                    args=(conn, addr), daemon=True
-                ).start()
-            except socket.timeout:
-                continue
-            except OSError:
-                break
+    def _accept(self, sel):
+        try:
+            conn, addr = self.server_socket.accept()
+        except (BlockingIOError, InterruptedError):
+            return
+        # Non-blocking: the reactor serves every node in the process, so
+        # neither a read nor a reply may wait on one slow client.
+        conn.setblocking(False)
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sel.register(conn, selectors.EVENT_READ, PeerConn(self, addr))
 
-    def _handle_connection(self, conn, addr):
-        buf = b''
-        conn.settimeout(10.0)
+    def _read_conn(self, sel, conn, state):
         try:
-            while self.running:
-                try:
-                    data = conn.recv(4096)
-                    if not data:
-                        break
-                    buf += data
-                    msgs, buf = parse_messages(buf)
-                    for m in msgs:
-                        self._dispatch(m, conn, addr)
-                except socket.timeout:
-                    break
-                except ConnectionResetError:
-                    break
-        finally:
-            conn.close()
+            data = conn.recv(65536)
+        except (BlockingIOError, InterruptedError, socket.timeout):
+            return
+        except OSError:
+            data = b''
+        if not data:
+            self._close_conn(sel, conn)
+            return
+        state.last_seen = time.monotonic_ns()
+        state.buf += data
+        try:
+            msgs, state.buf = parse_messages(state.buf)
+        except FrameError as e:
+            # Framing is lost; serve what arrived intact, then hang up
+            self.logger.warning("Closing %s:%s — %s", *state.addr[:2], e)
+            for m in e.messages:
+                self._dispatch(m, conn, state.addr)
+            self._close_conn(sel, conn)
+            return
+        for m in msgs:
+            self._dispatch(m, conn, state.addr)
 
-    def _dispatch(self, msg, conn, addr):
-        t = msg.get("type")
-        p = msg.get("payload", {})
+    @staticmethod
+    def _close_conn(sel, conn):
+        try:
+            sel.unregister(conn)
+        except (KeyError, ValueError):
+            pass                          # a failed reply closed it first
+        conn.close()
 
-        if   t == MSG_GOSSIP:           self._on_gossip(p, addr)
-        elif t == MSG_PING:             self._on_ping(p, conn)
-        elif t == MSG_PONG:             self._on_pong(p)
-        elif t == MSG_SUSPECT_QUERY:    self._on_suspect_query(p, conn)
-        elif t == MSG_SUSPECT_RESPONSE: pass  # handled inline
+    def _dispatch(self, msg, conn, addr):
+        h = self._handlers.get(msg.get("type"))
+        if h:
+            h(msg.get("payload", {}), conn, addr)
 
     # ── TCP helpers ───────────────────────────────────────────────────────
 
-    def _send_to_peer(self, host, port, message) -> bool:
+    def _conn_lock(self, pid):
+        with self._conn_pool_lock:
+            lock = self._conn_locks.get(pid)
+            if lock is None:
+                lock = self._conn_locks[pid] = threading.Lock()
+            return lock
+
+    def _get_conn(self, pid, host, port):
+        """Return (entry, reused) for pid, connecting if needed.  Hold its lock."""
+        entry = self._conn_pool.get(pid)
+        if entry is not None:
+            if self._conn_alive(entry[0]):
+                return entry, True
+            self._evict_conn(pid)             # remote closed it while idle
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        s.settimeout(3.0)
         try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.settimeout(3.0)
             s.connect((host, port))
-            s.sendall(message)
+        except OSError:
             s.close()
-            return True
-        except (ConnectionRefusedError, socket.timeout, OSError):
+            raise
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, "TCP_USER_TIMEOUT"):       # Linux only
+            s.setsockopt(socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT,
+                         int(self.ping_interval * self.suspicion_threshold * 1000))
+        entry = self._conn_pool[pid] = [s, bytearray()]
+        return entry, False
+
+    @staticmethod
+    def _conn_alive(s) -> bool:
+        """Cheap check that the remote has not closed an idle stream."""
+        timeout = s.gettimeout()
+        s.setblocking(False)      # a timeout socket would wait out the timeout
+        try:
+            return s.recv(1, socket.MSG_PEEK) != b''
+        except (BlockingIOError, InterruptedError):
+            return True                       # open, nothing pending
+        except OSError:
             return False
+        finally:
+            s.settimeout(timeout)
+
+    def _evict_conn(self, pid):
+        entry = self._conn_pool.pop(pid, None)
+        if entry is not None:
+            try:
+                entry[0].close()
+            except OSError:
+                pass
+
+    def _send_to_peer(self, host, port, message) -> bool:
+        """
+        Send a one-way frame on the pooled stream.
+
+        If another thread holds the stream, the frame is queued and that
+        thread writes it; True then means "queued", not "delivered".
+        """
+        pid = peer_id(host, port)
+        with self._conn_pool_lock:
+            self._outq.setdefault(pid, []).append(message)
+        return self._drain(pid, host, port)
+
+    def _drain(self, pid, host, port) -> bool:
+        lock = self._conn_lock(pid)
+        ok = True
+        while lock.acquire(blocking=False):
+            try:
+                with self._conn_pool_lock:
+                    frames = self._outq.pop(pid, None)
+                if frames:
+                    ok = self._flush(pid, host, port, frames)
+            finally:
+                lock.release()
+            # A frame queued while we held the lock is ours to send too
+            with self._conn_pool_lock:
+                if not self._outq.get(pid):
+                    break
+        return ok
+
+    def _flush(self, pid, host, port, frames) -> bool:
+        """Write frames in one gathered send.  Hold the stream's lock."""
+        for _ in range(2):                         # retry once on a stale stream
+            try:
+                entry, reused = self._get_conn(pid, host, port)
+            except OSError:
+                return False
+            s = entry[0]
+            try:
+                s.settimeout(3.0)
+                if len(frames) == 1 or not hasattr(s, "sendmsg"):
+                    s.sendall(b''.join(frames))
+                else:
+                    sent = s.sendmsg(frames)
+                    if sent < sum(map(len, frames)):
+                        s.sendall(b''.join(frames)[sent:])
+                return True
+            except OSError:
+                self._evict_conn(pid)
+                if not reused:
+                    return False
+        return False
 
     def _send_with_response(self, host, port, message, timeout=3.0):
+        """Send a request on the pooled stream and wait for its reply."""
+        pid = peer_id(host, port)
+        responses = self._request(pid, host, port, message, timeout)
+        if self._outq.get(pid):
+            self._drain(pid, host, port)     # frames queued behind the request
+        return responses
+
+    def _request(self, pid, host, port, message, timeout):
+        with self._conn_lock(pid):
+            for _ in range(2):
+                try:
+                    entry, reused = self._get_conn(pid, host, port)
+                except OSError:
+                    return []
+                s, buf = entry
+                try:
+                    s.settimeout(timeout)
+                    s.sendall(message)
+                    deadline = time.monotonic_ns() + int(timeout * _NS_PER_SEC)
+                    while time.monotonic_ns() < deadline:
+                        data = s.recv(4096)
+                        if not data:
+                            raise ConnectionResetError
+                        buf += data
+                        msgs, buf = parse_messages(buf)
+                        if msgs:
+                            return msgs
+                except socket.timeout:
+                    pass
+                except OSError:
+                    self._evict_conn(pid)
+                    if reused:
+                        continue                   # peer closed an idle stream
+                    return []
+                # No reply in time — drop the stream so a late reply
+                # cannot be mistaken for the answer to the next request.
+                self._evict_conn(pid)
+                return []
+        return []
+
+    def _send_once_with_response(self, host, port, message, timeout=3.0):
         responses = []
         try:
             s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             s.settimeout(timeout)
             s.connect((host, port))
             s.sendall(message)
-            buf = b''
-            deadline = time.time() + timeout
-            while time.time() < deadline:
+            buf = bytearray()
+            deadline = time.monotonic_ns() + int(timeout * _NS_PER_SEC)
+            while time.monotonic_ns() < deadline:
                 try:
                     data = s.recv(4096)
                     if not data:
@@ -231,8 +629,8 @@ class PeerNode:
         return responses
 
     def _send_to_seed(self, seed, message, timeout=10.0):
-        return self._send_with_response(seed["host"], seed["port"],
-                                         message, timeout)
+        return self._send_once_with_response(seed["host"], seed["port"],
+                                              message, timeout)
 
     # ═════════════════════════════════════════════════════════════════════════
     # Registration  (Seed Communication)
@@ -326,46 +724,43 @@ class PeerNode:
         self.logger.info(f"Building overlay: target degree={target}  "
                          f"(from {n} available peers)")
 
-        # Zipf-weighted selection (α = 1.0)
+        # Zipf-weighted selection (α = 1.0), without replacement.  Keying
+        # each rank by u^(1/w) and keeping the `target` largest keys draws
+        # exactly like sequential weighted sampling, in one pass.
         ids = list(available.keys())
         random.shuffle(ids)
         alpha = 1.0
-        weights = [1.0 / ((i + 1) ** alpha) for i in range(len(ids))]
-        total_w = sum(weights)
-        probs   = [w / total_w for w in weights]
-
-        selected = set()
-        attempts = 0
-        while len(selected) < target and attempts < target * 10:
-            r, cum = random.random(), 0.0
-            for i, p in enumerate(probs):
-                cum += p
-                if r <= cum:
-                    selected.add(ids[i])
-                    break
-            attempts += 1
+        keys = [random.random() ** ((i + 1) ** alpha) for i in range(n)]
+        selected = [ids[i] for i in
+                    heapq.nlargest(target, range(n), key=keys.__getitem__)]
 
         with self.neighbors_lock:
             for pid in selected:
                 info = available[pid]
                 self.neighbors[pid] = {"host": info["host"],
                                        "port": info["port"]}
+            self._publish_neighbors()
 
         self.logger.info(f"Overlay built: degree={len(self.neighbors)}  "
                          f"neighbors={list(self.neighbors.keys())}")
 
+    def _publish_neighbors(self):
+        """Swap in a fresh neighbor snapshot.  Hold neighbors_lock."""
+        self._neighbors_snapshot = tuple(self.neighbors.items())
+        self._neighbor_ids = frozenset(self.neighbors)
+
     # ═════════════════════════════════════════════════════════════════════════
     # Gossip Engine   (max 10 messages, every 5 s)
     # ═════════════════════════════════════════════════════════════════════════
 
-    def _gossip_loop(self):
-        time.sleep(2)                                    # let overlay settle
-        while self.running:
-            with self.msg_counter_lock:
-                if self.msg_counter >= self.max_gossip_messages:
-                    break                                # ──► cap reached
-            self._generate_gossip()
-            time.sleep(self.gossip_interval)
+    def _gossip_tick(self):
+        """Periodic job: one gossip per tick; False ends it at the cap."""
+        if not self.running:
+            return False
+        with self.msg_counter_lock:
+            if self.msg_counter >= self.max_gossip_messages:
+                return False                             # ──► cap reached
+        self._generate_gossip()
 
     def _generate_gossip(self):
         """Create and disseminate one gossip message."""
@@ -380,107 +775,162 @@ class PeerNode:
         msg_id   = gossip_message_id(ts, self.host, self.port, msg_num)
         msg_hash = hash_message(msg_id)
 
-        with self.message_list_lock:
-            self.message_list[msg_hash] = {
-                "id": msg_id, "timestamp": ts,
+        shard = self._msg_shard(msg_hash)
+        with shard.lock:
+            shard.table[msg_hash] = {
+                "id": msg_id, "timestamp": ts, "seen_ns": time.monotonic_ns(),
                 "origin": self.my_id, "msg_num": msg_num,
+                "seen_at": set(),
             }
+            shard.seen.add(msg_hash)
 
         self.logger.info(f"Generated gossip #{msg_num}/{self.max_gossip_messages}: "
                          f"{msg_id}")
-        self._forward_gossip(msg_id, msg_hash, sender=None)
-
-    def _forward_gossip(self, msg_id, msg_hash, sender=None):
-        """Forward M to all neighbors except sender."""
-        with self.neighbors_lock:
-            targets = dict(self.neighbors)
+        self._forward_gossip(msg_id, msg_hash)
+
+    def _forward_gossip(self, msg_id, msg_hash):
+        """Forward M to every neighbor not already known to have it."""
+        shard = self._msg_shard(msg_hash)
+        with shard.lock:
+            rec = shard.table.get(msg_hash)
+            seen_at = set(rec["seen_at"]) if rec else set()
+        targets = [(pid, info) for pid, info in self._neighbors_snapshot
+                   if pid not in seen_at]
+        if not targets:
+            return
 
-        for pid, info in targets.items():
-            if pid == sender:
-                continue
-            self._send_to_peer(
-                info["host"], info["port"],
-                make_message(MSG_GOSSIP, {
-                    "msg_id": msg_id,
-                    "msg_hash": msg_hash,
-                    "sender": self.my_id,
-                })
-            )
+        # IHAVE list: this node, everyone it is about to send to, then
+        # anyone else known to hold M — receivers skip all of them.
+        have = [self.my_id] + [pid for pid, _ in targets]
+        have.extend(seen_at.difference(have))
+        # The hash is not sent: every receiver derives it from msg_id,
+        # which it needs anyway for logging.
+        frame = make_message(MSG_GOSSIP, {
+            "msg_id": msg_id,
+            "sender": self.my_id,
+            "seen": have[:IHAVE_MAX],
+        })
+        for pid, info in targets:
+            self._send_to_peer(info["host"], info["port"], frame)
 
     def _on_gossip(self, payload, addr):
         """Handle incoming gossip: store if new, forward, else ignore."""
-        msg_id   = payload.get("msg_id")
-        msg_hash = payload.get("msg_hash")
-        sender   = payload.get("sender")
-        if not msg_id or not msg_hash:
+        msg_id = payload.get("msg_id")
+        sender = payload.get("sender")
+        if not msg_id or not isinstance(msg_id, str):
             return
-
-        with self.message_list_lock:
-            if msg_hash in self.message_list:
-                return                                   # duplicate → ignore
-            self.message_list[msg_hash] = {
+        msg_hash = hash_message(msg_id)      # never trust a sender's hash
+        # The IHAVE list is the sender's unverified claim.  Only entries
+        # naming our own neighbors are kept, so ids it makes up are never
+        # stored or relayed in our IHAVE list to suppress sends further
+        # on.  The sender itself plainly holds the message.
+        seen = payload.get("seen")
+        nbr_ids = self._neighbor_ids
+        known = ({p for p in seen[:IHAVE_MAX]
+                  if isinstance(p, str) and p in nbr_ids}
+                 if isinstance(seen, list) else set())
+        if isinstance(sender, str):
+            known.add(sender)
+
+        # The table only holds hashes the filter still remembers (it is
+        # pruned as the filter rotates), so a filter miss means the hash
+        # is new and only a hit needs the authoritative lookup.  Both are
+        # read under the shard lock, which also guards the rotation.
+        shard = self._msg_shard(msg_hash)
+        with shard.lock:
+            if msg_hash in shard.seen and msg_hash in shard.table:
+                # Duplicate → drop, but remember who else holds it so a
+                # pending forward can skip them.
+                shard.table[msg_hash]["seen_at"].update(known)
+                return
+            now = time.monotonic_ns()
+            if shard.seen.maybe_rotate():
+                self._expire_messages(shard, shard.seen.kept_since)
+            shard.table[msg_hash] = {
                 "id": msg_id,
-                "timestamp": time.time(),
+                "seen_ns": now,
                 "received_from": sender,
+                "seen_at": known,
             }
+            shard.seen.add(msg_hash)
 
         # ── LOG: First-time gossip (with timestamp & sender IP) ───────────
         self.logger.info(f"Gossip received  [from={sender}, msg={msg_id}, "
-                         f"time={time.strftime('%Y-%m-%d %H:%M:%S')}]")
+                         f"time={self._log_time()}]")
+
+        self._handler_pool.submit(self._forward_gossip, msg_id, msg_hash)
+
+    def _log_time(self) -> str:
+        sec = int(time.time())
+        cached_sec, text = self._cached_ts
+        if sec != cached_sec:
+            text = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(sec))
+            self._cached_ts = (sec, text)
+        return text
 
-        self._forward_gossip(msg_id, msg_hash, sender=sender)
+    def _msg_shard(self, msg_hash) -> MessageShard:
+        return self._msg_shards[hash(msg_hash) & (MSG_SHARDS - 1)]
+
+    @staticmethod
+    def _expire_messages(shard, cutoff):
+        """Drop entries the shard's filter has forgotten.  Hold shard.lock."""
+        stale = [h for h, m in shard.table.items() if m["seen_ns"] < cutoff]
+        for h in stale:
+            del shard.table[h]
 
     # ═════════════════════════════════════════════════════════════════════════
     # Liveness Detection  (TCP-level ping;  ping msgs NOT logged)
     # ═════════════════════════════════════════════════════════════════════════
 
-    def _liveness_loop(self):
-        time.sleep(5)
-        while self.running:
-            self._ping_all_neighbors()
-            time.sleep(self.ping_interval)
-            self._check_suspicions()
+    def _liveness_tick(self):
+        """Periodic job: act on the last sweep's misses, then ping again."""
+        if not self.running:
+            return False
+        self._check_suspicions()
+        self._ping_all_neighbors()
 
     def _ping_all_neighbors(self):
-        with self.neighbors_lock:
-            targets = dict(self.neighbors)
-
-        for pid, info in targets.items():
-            responses = self._send_with_response(
+        futs = {
+            self._probe_pool.submit(
+                self._send_with_response,
                 info["host"], info["port"],
-                make_message(MSG_PING, {
-                    "sender": self.my_id,
-                    "timestamp": time.time(),
-                }),
+                self._ping_bytes,
                 timeout=self.ping_timeout
-            )
-            got_pong = any(r.get("type") == MSG_PONG for r in responses)
-            if got_pong:
-                with self.ping_lock:
-                    self.ping_responses[pid] = time.time()
-                with self.suspected_lock:
-                    self.suspicion_counts.pop(pid, None)
-                    self.suspected_nodes.discard(pid)
+            ): pid
+            for pid, info in self._neighbors_snapshot
+        }
+        done, _ = wait(futs, timeout=self.ping_timeout + 0.5)
+
+        # Classify the whole sweep first, then apply it with one lock
+        # acquisition per table rather than one or two per neighbor.
+        alive, missed = [], []
+        for fut, pid in futs.items():
+            responses = fut.result() if fut in done else []
+            if any(r.get("type") == MSG_PONG for r in responses):
+                alive.append(pid)
             else:
-                with self.suspected_lock:
-                    self.suspicion_counts[pid] = \
-                        self.suspicion_counts.get(pid, 0) + 1
-                    # (ping miss is NOT logged per spec)
+                missed.append(pid)          # (ping miss is NOT logged per spec)
+
+        if alive:
+            now = time.monotonic_ns()
+            with self.ping_lock:
+                self.ping_responses.update(dict.fromkeys(alive, now))
+        with self.suspected_lock:
+            counts = self.suspicion_counts
+            for pid in alive:
+                counts.pop(pid, None)
+            self.suspected_nodes.difference_update(alive)
+            for pid in missed:
+                counts[pid] = counts.get(pid, 0) + 1
 
     def _on_ping(self, payload, conn):
-        try:
-            conn.sendall(make_message(MSG_PONG, {
-                "sender": self.my_id,
-                "timestamp": time.time(),
-            }))
-        except OSError:
-            pass
+        self._runtime.reply(conn, self._pong_bytes)
 
     def _on_pong(self, payload):
         s = payload.get("sender")
         if s:
             with self.ping_lock:
-                self.ping_responses[s] = time.time()
+                self.ping_responses[s] = time.monotonic_ns()
 
     # ═════════════════════════════════════════════════════════════════════════
     # Peer-Level Consensus  (Phase 2 of failure detection)
@@ -505,18 +955,20 @@ class PeerNode:
 
             confirm = 1          # we already suspect it
             total   = 1
-            with self.neighbors_lock:
-                others = {p: i for p, i in self.neighbors.items()
-                          if p != suspect_id}
-            for pid, info in others.items():
-                total += 1
-                for resp in self._send_with_response(
-                    info["host"], info["port"],
-                    make_message(MSG_SUSPECT_QUERY, {
-                        "sender": self.my_id,
-                        "suspect": suspect_id,
-                    }), timeout=3.0
-                ):
+            others = [i for p, i in self._neighbors_snapshot
+                      if p != suspect_id]
+            query = make_message(MSG_SUSPECT_QUERY, {
+                "sender": self.my_id,
+                "suspect": suspect_id,
+            })
+            futs = [self._probe_pool.submit(self._send_with_response,
+                                            info["host"], info["port"],
+                                            query, timeout=3.0)
+                    for info in others]
+            total += len(futs)
+            done, _ = wait(futs, timeout=3.5)
+            for fut in done:
+                for resp in fut.result():
                     if resp.get("type") == MSG_SUSPECT_RESPONSE:
                         if resp["payload"].get("confirmed"):
                             confirm += 1
@@ -530,6 +982,7 @@ class PeerNode:
                 self._report_dead_node(suspect_id, confirm)
                 with self.neighbors_lock:
                     self.neighbors.pop(suspect_id, None)
+                    self._publish_neighbors()
             else:
                 self.logger.info(f"Suspicion cancelled for {suspect_id}")
                 with self.suspected_lock:
@@ -547,27 +1000,22 @@ class PeerNode:
 
         # Also try a live probe
         if not confirmed:
-            with self.neighbors_lock:
-                info = self.neighbors.get(suspect_id)
+            info = next((i for p, i in self._neighbors_snapshot
+                         if p == suspect_id), None)
             if info:
                 resps = self._send_with_response(
                     info["host"], info["port"],
-                    make_message(MSG_PING, {
-                        "sender": self.my_id,
-                        "timestamp": time.time(),
-                    }), timeout=2.0
+                    self._ping_bytes, timeout=2.0
                 )
                 if not any(r.get("type") == MSG_PONG for r in resps):
                     confirmed = True
 
-        try:
-            conn.sendall(make_message(MSG_SUSPECT_RESPONSE, {
-                "sender": self.my_id,
-                "suspect": suspect_id,
-                "confirmed": confirmed,
-            }))
-        except OSError:
-            pass
+        # Runs on the handler pool; the reactor owns the inbound stream
+        self._runtime.reply_soon(conn, make_message(MSG_SUSPECT_RESPONSE, {
+            "sender": self.my_id,
+            "suspect": suspect_id,
+            "confirmed": confirmed,
+        }))
 
     # ═════════════════════════════════════════════════════════════════════════
     # Dead-Node Reporting  (→ seeds for seed-level consensus)
@@ -585,35 +1033,31 @@ class PeerNode:
         # ── LOG: Confirmed dead-node report ───────────────────────────────
         self.logger.info(f"DEAD NODE REPORT: {report_str}")
 
-        for seed in self.seeds:
-            msg = make_message(MSG_DEAD_NODE_REPORT, {
-                "dead_peer_id":  dead_id,
-                "reporter_id":   self.my_id,
-                "peer_votes":    peer_votes,
-                "timestamp":     ts,
-                "report_string": report_str,
-            })
-            try:
-                s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                s.settimeout(5.0)
-                s.connect((seed["host"], seed["port"]))
-                s.sendall(msg)
-                s.close()
-            except (ConnectionRefusedError, socket.timeout, OSError) as e:
-                self.logger.warning(
-                    f"Failed to report to seed "
-                    f"{seed['host']}:{seed['port']}: {e}"
-                )
+        msg = make_message(MSG_DEAD_NODE_REPORT, {
+            "dead_peer_id":  dead_id,
+            "reporter_id":   self.my_id,
+            "peer_votes":    peer_votes,
+            "timestamp":     ts,
+            "report_string": report_str,
+        })
+        sent = self._probe_pool.map(
+            lambda seed: self._send_to_peer(seed["host"], seed["port"], msg),
+            self.seeds)
+        failed = [f"{seed['host']}:{seed['port']}"
+                  for seed, ok in zip(self.seeds, sent) if not ok]
+        if failed:
+            self.logger.warning(f"Failed to report to seeds: {failed}")
 
     # ═════════════════════════════════════════════════════════════════════════
     # Status helper
     # ═════════════════════════════════════════════════════════════════════════
 
     def get_status(self) -> dict:
-        with self.neighbors_lock:
-            nbrs = list(self.neighbors.keys())
-        with self.message_list_lock:
-            mc = len(self.message_list)
+        nbrs = [pid for pid, _ in self._neighbors_snapshot]
+        mc = 0
+        for shard in self._msg_shards:
+            with shard.lock:
+                mc += len(shard.table)
         return {
             "peer_id": self.my_id,
             "registered": self.registered,
@@ -2,15 +2,49 @@
 Shared protocol definitions for the Gossip P2P Network.
 
 Message types and serialization for seed-seed, seed-peer, and peer-peer communication.
-All messages are JSON-encoded and terminated with a newline delimiter.
+Every message is a JSON body preceded by its length as a 4-byte
+little-endian unsigned integer.
 """
 
 import json
 import hashlib
+import re
+import struct
 import time
 
-# ─── Delimiter for TCP framing ───────────────────────────────────────────────
-MSG_DELIMITER = b'\n'
+try:                                   # optional: faster, wire-identical JSON
+    import orjson
+except ImportError:
+    orjson = None
+
+# ─── Length-prefix TCP framing ───────────────────────────────────────────────
+FRAME_HEADER = struct.Struct('<I')
+MAX_MESSAGE_SIZE = 16 * 1024 * 1024     # Larger lengths mean a corrupt stream
+
+
+class FrameError(ConnectionError):
+    """
+    A length header is out of range, so the stream has lost its framing.
+    The connection cannot resync and must be closed; .messages holds the
+    frames decoded before the bad header.
+    """
+
+    def __init__(self, size, messages):
+        super().__init__(f"bad frame length {size}")
+        self.messages = messages
+
+# Body codec — orjson when installed, else the stdlib; both emit compact
+# UTF-8 JSON, so nodes with and without orjson interoperate.
+if orjson is not None:
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    _loads = orjson.loads                # also takes a memoryview, no copy
+else:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    def _loads(body):
+        return json.loads(bytes(body))   # json rejects memoryview input
 
 # ─── Message Types ───────────────────────────────────────────────────────────
 
@@ -45,6 +79,10 @@ MAX_GOSSIP_MESSAGES = 10
 # ─── Gossip generation interval (seconds) ────────────────────────────────────
 GOSSIP_INTERVAL = 5
 
+# ─── Gossip dedup window (seconds) ───────────────────────────────────────────
+# Hashes are remembered for one to two windows; a flood settles in seconds.
+GOSSIP_DEDUP_WINDOW = 60
+
 
 # ─── Message Construction ────────────────────────────────────────────────────
 
@@ -55,23 +93,39 @@ def make_message(msg_type: str, payload: dict = None) -> bytes:
         "timestamp": time.time(),
         "payload": payload or {}
     }
-    return json.dumps(msg).encode('utf-8') + MSG_DELIMITER
+    body = _dumps(msg)
+    return FRAME_HEADER.pack(len(body)) + body
 
 
-def parse_messages(buffer: bytes):
+def parse_messages(buffer):
     """
-    Parse one or more messages from a byte buffer.
+    Parse all complete messages from a byte buffer.
     Returns (list_of_parsed_messages, remaining_buffer).
+
+    A bytearray is trimmed in place and returned, so readers can keep one
+    buffer per connection and append with += instead of rebuilding bytes.
+    Bodies are decoded from memoryview slices of the buffer.
+    Raises FrameError if a length header exceeds MAX_MESSAGE_SIZE.
     """
     messages = []
-    while MSG_DELIMITER in buffer:
-        line, buffer = buffer.split(MSG_DELIMITER, 1)
-        if line.strip():
+    off, end = 0, len(buffer)
+    with memoryview(buffer) as view:  # released before the in-place trim
+        while end - off >= FRAME_HEADER.size:
+            (size,) = FRAME_HEADER.unpack_from(view, off)
+            if size > MAX_MESSAGE_SIZE:
+                raise FrameError(size, messages)
+            start = off + FRAME_HEADER.size
+            if end - start < size:
+                break                 # Body not fully received yet
+            off = start + size
             try:
-                messages.append(json.loads(line.decode('utf-8')))
-            except (json.JSONDecodeError, UnicodeDecodeError):
+                messages.append(_loads(view[start:off]))
+            except (ValueError, UnicodeDecodeError):
                 pass  # Skip malformed messages
-    return messages, buffer
+    if isinstance(buffer, bytearray):
+        del buffer[:off]
+        return messages, buffer
+    return messages, buffer[off:]
 
 
 def gossip_message_id(timestamp: float, ip: str, port: int, msg_num: int) -> str:
@@ -83,8 +137,12 @@ def gossip_message_id(timestamp: float, ip: str, port: int, msg_num: int) -> str
 
 
 def hash_message(content: str) -> str:
-    """SHA-256 hash of a message for deduplication."""
-    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+    """
+    128-bit BLAKE2b digest of a message, as 32 hex chars.
+
+    Used only to deduplicate gossip in memory — not a security primitive.
+    """
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
 
 
 def peer_id(host: str, port: int) -> str:
@@ -106,30 +164,82 @@ def dead_node_message(dead_ip: str, dead_port: int, self_timestamp: float, self_
     return f"Dead Node:{dead_ip}:{dead_port}:{self_timestamp}:{self_ip}"
 
 
+# ─── Gossip Dedup Filter ─────────────────────────────────────────────────────
+
+class BloomFilter:
+    """
+    Two-generation Bloom filter over message hashes.
+
+    Answers "definitely not seen" without touching the message store.
+    Every `rotate_every` seconds the older generation is dropped, so a
+    hash is forgotten one to two windows after it was last added.
+    `kept_since` is the monotonic_ns start of the older generation still
+    held: exactly the hashes added since then are remembered.
+    """
+
+    _MASK64 = (1 << 64) - 1
+
+    def __init__(self, m_bits: int = 1 << 20, k: int = 4,
+                 rotate_every: float = GOSSIP_DEDUP_WINDOW):
+        self.m = m_bits
+        self.k = k
+        self.rotate_every = rotate_every
+        self._rotate_ns = int(rotate_every * 1_000_000_000)
+        self._cur  = bytearray(m_bits // 8)
+        self._prev = bytearray(m_bits // 8)
+        now = time.monotonic_ns()
+        self._cur_since = self.kept_since = now
+        self._next_rotate = now + self._rotate_ns
+
+    def _positions(self, key: str):
+        # Hex digests are already uniform; fall back to hashing anything else
+        try:
+            h = int(key[:32], 16)
+        except ValueError:
+            h = int.from_bytes(hashlib.blake2b(key.encode('utf-8'),
+                                               digest_size=16).digest(), 'big')
+        h1, h2 = h & self._MASK64, (h >> 64) | 1     # double hashing
+        return [(h1 + i * h2) % self.m for i in range(self.k)]
+
+    def add(self, key: str):
+        cur = self._cur
+        for b in self._positions(key):
+            cur[b >> 3] |= 1 << (b & 7)
+
+    def __contains__(self, key: str) -> bool:
+        pos = self._positions(key)
+        for gen in (self._cur, self._prev):
+            if all(gen[b >> 3] & (1 << (b & 7)) for b in pos):
+                return True
+        return False
+
+    def maybe_rotate(self) -> bool:
+        """Start a new generation if the window elapsed; True if rotated."""
+        now = time.monotonic_ns()
+        if now < self._next_rotate:
+            return False
+        self._prev, self._cur = self._cur, bytearray(self.m // 8)
+        self.kept_since, self._cur_since = self._cur_since, now
+        self._next_rotate = now + self._rotate_ns
+        return True
+
+
 # ─── Config File Parser ─────────────────────────────────────────────────────
 
+# One seed per line as  IP:Port  or  IP,Port.  The host may itself hold
+# colons (IPv6); the lazy host group makes the port the last :-field.
+_SEED_RE = re.compile(
+    rb'^[ \t]*([^\s#,][^,\r\n]*?)[ \t]*[,:][ \t]*(\d+)[ \t]*\r?$', re.M)
+
+
 def load_config(config_path: str) -> list:
     """
     Parse config.txt / config.csv.
     Each non-empty line is  IP:Port  of a seed node.
     Returns a list of dicts: [{"host": str, "port": int}, ...]
     """
-    seeds = []
-    with open(config_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            # Support both  IP:Port  and  IP,Port  formats
-            if ',' in line:
-                parts = line.split(',', 1)
-            else:
-                parts = line.rsplit(':', 1)
-            if len(parts) == 2:
-                host = parts[0].strip()
-                try:
-                    port = int(parts[1].strip())
-                    seeds.append({"host": host, "port": port})
-                except ValueError:
-                    pass  # Skip malformed lines
-    return seeds
+    with open(config_path, 'rb') as f:
+        data = f.read()
+    # Comments and malformed lines simply do not match
+    return [{"host": m.group(1).decode('utf-8'), "port": int(m.group(2))}
+            for m in _SEED_RE.finditer(data)]
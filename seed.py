@@ -18,25 +18,45 @@ Usage:
 """
 
 import argparse
+import asyncio
+import itertools
+import logging
 import os
+from collections import OrderedDict
 import socket
-import threading
 import time
-import uuid
 
 from protocol import (
-    MSG_DELIMITER,
     MSG_REGISTER_REQUEST, MSG_REGISTER_ACK, MSG_REGISTER_NACK,
     MSG_DEAD_NODE_REPORT, MSG_GET_PEER_LIST, MSG_PEER_LIST,
     MSG_PROPOSE_REGISTER, MSG_VOTE_REGISTER,
     MSG_PROPOSE_REMOVE,   MSG_VOTE_REMOVE,
     MSG_SEED_SYNC, MSG_REMOVAL_NOTIFY,
-    make_message, parse_messages,
+    make_message, parse_messages, FrameError,
     peer_id, parse_peer_id, load_config
 )
 from logger import get_logger
 
 
+PROPOSAL_TTL      = 60.0           # s a settled proposal is kept for lookups
+SYNC_LOG_MAX      = 1024           # local membership ops kept for deltas
+SEED_CONN_IDLE    = 30.0           # s before a pooled seed link is reaped
+IDLE_CONN_TIMEOUT = 2 * SEED_CONN_IDLE   # inbound idle cut-off; outlives the
+                                         # reap so the dialer closes first
+
+
+class SeedConn:
+    """One pooled outbound link to another seed, shared by all requests."""
+    __slots__ = ("reader", "writer", "waiters", "last_used", "task")
+
+    def __init__(self, reader, writer):
+        self.reader    = reader
+        self.writer    = writer
+        self.waiters   = {}                # {proposal_id: Future[reply]}
+        self.last_used = time.monotonic()
+        self.task      = None
+
+
 class SeedNode:
     """
     Distributed membership authority for the gossip network.
@@ -55,8 +75,17 @@ class SeedNode:
         self.logger = get_logger(f"Seed-{port}", node_type="seed", port=port)
 
         # ── Membership State ──────────────────────────────────────────────
+        # Published snapshot: writers copy, edit and rebind it; readers just
+        # take the reference.
         self.peer_list = {}                       # {peer_id: {"host", "port", "joined"}}
-        self.peer_list_lock = threading.Lock()
+        # Bumped on every peer_list change.  Changes decided here are also
+        # logged as (version, op, peer_id, info) so seed sync ships deltas.
+        self.version    = 0
+        self._ops       = []
+        self._ops_floor = 0                       # versions ≤ this were trimmed
+        # Encoded PEER_LIST reply for the version it was built at; its
+        # envelope timestamp is the build time, which nothing reads.
+        self._peer_list_cache = (-1, b'')
 
         # ── Other Seeds ───────────────────────────────────────────────────
         self.other_seeds = [
@@ -67,16 +96,36 @@ class SeedNode:
         self.quorum = (self.total_seeds // 2) + 1     # ⌊n/2⌋ + 1
 
         # ── Consensus State ───────────────────────────────────────────────
-        self.proposals      = {}                  # {proposal_id: info}
-        self.proposals_lock = threading.Lock()
+        self.proposals    = OrderedDict()         # {proposal_id: info}, oldest first
+        # Proposal ids: seed id + boot time keep them unique across seeds and
+        # restarts.
+        self._pid_prefix  = f"{self.my_id}-{int(time.time()):x}"
+        self._pid_counter = itertools.count(1)
 
         # ── Pending peer connections awaiting decision ────────────────────
-        self.pending_responses = {}               # {proposal_id: (conn, addr)}
-        self.pending_lock      = threading.Lock()
-
-        # ── Server Socket ─────────────────────────────────────────────────
-        self.server_socket = None
-        self.running       = False
+        self.pending_responses = {}               # {proposal_id: (writer, addr)}
+
+        # ── Seed sync high-water marks ────────────────────────────────────
+        # Versions restart at 0 with every boot, so each one is only
+        # meaningful together with the boot epoch it was counted in.
+        self._epoch             = time.time_ns()
+        self._last_sent_version = {}              # {seed_id: version acked}
+        self._applied_version   = {}              # {seed_id: (epoch, version)}
+
+        # ── Seed-to-seed connection pool ──────────────────────────────────
+        self._seed_conns      = {}                # {seed_id: SeedConn}
+        # Connects in flight, one per seed, awaited by everyone who needs
+        # that link meanwhile; a seed that never answers only holds up
+        # its own callers.
+        self._seed_dials      = {}                # {seed_id: Task[SeedConn]}
+
+        # ── Server ────────────────────────────────────────────────────────
+        # Every connection is a coroutine on one event loop, and all state
+        # above is only touched from that loop's thread.  Nothing needs a
+        # lock unless it spans an await (the connection pool's does).
+        self.server  = None                       # asyncio.Server once bound
+        self._loop   = None
+        self.running = False
 
         self.logger.info(f"Seed node initialized at {self.my_id}")
         self.logger.info(f"Total seeds: {self.total_seeds}, Quorum: {self.quorum}")
@@ -88,158 +137,262 @@ class SeedNode:
     # ═════════════════════════════════════════════════════════════════════════
 
     def start(self):
-        """Start the seed node server."""
+        """Start the seed node server (blocks until stopped)."""
         self.running = True
-        self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self.server_socket.settimeout(1.0)
-        self.server_socket.bind((self.host, self.port))
-        self.server_socket.listen(50)
+        try:
+            asyncio.run(self._serve())
+        except KeyboardInterrupt:
+            self.logger.info("Shutting down seed node…")
+            self.stop()
+
+    async def _serve(self):
+        self._loop  = asyncio.get_running_loop()
+        self.server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port,
+            reuse_address=True, backlog=socket.SOMAXCONN)
 
         self.logger.info(f"Seed node listening on {self.host}:{self.port}")
 
-        # Listener thread for incoming TCP connections
-        threading.Thread(target=self._listen_loop, daemon=True).start()
         # Periodic peer-list synchronisation with other seeds
-        threading.Thread(target=self._sync_loop, daemon=True).start()
-
+        sync = asyncio.create_task(self._sync_loop())
         try:
-            while self.running:
-                time.sleep(0.5)
-        except KeyboardInterrupt:
-            self.logger.info("Shutting down seed node…")
-            self.stop()
+            async with self.server:
+                await self.server.serve_forever()
+        except asyncio.CancelledError:
+            pass                                  # server closed by stop()
+        finally:
+            sync.cancel()
+            for sc in list(self._seed_conns.values()):
+                sc.writer.close()
 
     def stop(self):
+        """Stop serving; safe to call from any thread."""
         self.running = False
-        if self.server_socket:
-            self.server_socket.close()
+        loop, server = self._loop, self.server
+        if server is not None and loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(server.close)
         self.logger.info("Seed node stopped.")
 
     # ═════════════════════════════════════════════════════════════════════════
     # Network Layer
     # ═════════════════════════════════════════════════════════════════════════
 
-    def _listen_loop(self):
-        """Accept incoming TCP connections."""
-        while self.running:
-            try:
-                conn, addr = self.server_socket.accept()
-                threading.Thread(
-                    target=self._handle_connection,
-                    args=(conn, addr), daemon=True
-                ).start()
-            except socket.timeout:
-                continue
-            except OSError:
-                break
-
-    def _handle_connection(self, conn: socket.socket, addr):
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter):
         """Read messages from one TCP connection."""
-        buf = b''
-        conn.settimeout(10.0)
+        addr = writer.get_extra_info("peername")
+        # asyncio already disables Nagle on TCP transports; keepalive lets
+        # the kernel reap pooled links whose far end vanished.
+        writer.get_extra_info("socket").setsockopt(
+            socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        buf = bytearray()
         try:
             while self.running:
                 try:
-                    data = conn.recv(4096)
-                    if not data:
-                        break
-                    buf += data
-                    msgs, buf = parse_messages(buf)
-                    for m in msgs:
-                        self._dispatch(m, conn, addr)
-                except socket.timeout:
+                    data = await asyncio.wait_for(reader.read(65536),
+                                                  IDLE_CONN_TIMEOUT)
+                except (asyncio.TimeoutError, ConnectionError):
+                    break
+                if not data:
                     break
-                except ConnectionResetError:
+                buf += data
+                try:
+                    msgs, buf = parse_messages(buf)
+                except FrameError as e:
+                    # Framing is lost; serve what arrived intact, then hang up
+                    self.logger.warning("Closing %s — %s", addr, e)
+                    for m in e.messages:
+                        await self._dispatch(m, writer, addr)
                     break
+                for m in msgs:
+                    await self._dispatch(m, writer, addr)
         finally:
-            conn.close()
+            writer.close()
 
-    def _dispatch(self, msg: dict, conn, addr):
+    async def _dispatch(self, msg: dict, conn, addr):
         """Route an incoming message to the appropriate handler."""
         t = msg.get("type")
         p = msg.get("payload", {})
 
-        if   t == MSG_REGISTER_REQUEST:  self._on_register_request(p, conn, addr)
-        elif t == MSG_DEAD_NODE_REPORT:  self._on_dead_node_report(p, conn, addr)
-        elif t == MSG_GET_PEER_LIST:     self._on_get_peer_list(conn, addr)
-        elif t == MSG_PROPOSE_REGISTER:  self._on_propose_register(p, conn)
+        if   t == MSG_REGISTER_REQUEST:  await self._on_register_request(p, conn, addr)
+        elif t == MSG_DEAD_NODE_REPORT:  await self._on_dead_node_report(p, conn, addr)
+        elif t == MSG_GET_PEER_LIST:     await self._on_get_peer_list(conn, addr)
+        elif t == MSG_PROPOSE_REGISTER:  await self._on_propose_register(p, conn)
         elif t == MSG_VOTE_REGISTER:     self._on_vote_register(p)
-        elif t == MSG_PROPOSE_REMOVE:    self._on_propose_remove(p, conn)
+        elif t == MSG_PROPOSE_REMOVE:    await self._on_propose_remove(p, conn)
         elif t == MSG_VOTE_REMOVE:       self._on_vote_remove(p)
-        elif t == MSG_SEED_SYNC:         self._on_seed_sync(p)
+        elif t == MSG_SEED_SYNC:         await self._on_seed_sync(p, conn)
         else:
-            self.logger.warning(f"Unknown message type: {t}")
+            self.logger.warning("Unknown message type: %s", t)
 
-    # ── helpers to talk to other seeds ────────────────────────────────────
+    @staticmethod
+    async def _reply(writer: asyncio.StreamWriter, message: bytes):
+        """Write one framed message back on an inbound connection."""
+        writer.write(message)
+        await writer.drain()
 
-    def _send_to_seed(self, seed_info, message: bytes) -> bool:
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.settimeout(5.0)
-            s.connect((seed_info["host"], seed_info["port"]))
-            s.sendall(message)
-            time.sleep(0.1)
-            s.close()
-            return True
-        except (ConnectionRefusedError, socket.timeout, OSError) as e:
-            self.logger.warning(f"Cannot reach seed "
-                                f"{seed_info['host']}:{seed_info['port']}: {e}")
-            return False
-
-    def _send_to_seed_with_response(self, seed_info, message: bytes,
-                                     timeout=5.0) -> list:
-        responses = []
+    # ── helpers to talk to other seeds ────────────────────────────────────
+    # Requests share one long-lived connection per seed.  Replies carry the
+    # proposal_id (or sync_id) they answer, so a reader task per link routes each one to
+    # the request awaiting it and several proposals can be in flight at once.
+
+    async def _get_seed_conn(self, seed_info) -> SeedConn:
+        sid = peer_id(seed_info["host"], seed_info["port"])
+        sc = self._seed_conns.get(sid)
+        if sc is not None and not sc.writer.is_closing():
+            return sc
+        dial = self._seed_dials.get(sid)
+        if dial is None:
+            dial = asyncio.create_task(self._dial_seed(sid, seed_info))
+            self._seed_dials[sid] = dial
+            dial.add_done_callback(lambda t: self._dial_done(sid, t))
+        # Shielded: a caller giving up must not cancel the others' dial
+        return await asyncio.shield(dial)
+
+    async def _dial_seed(self, sid, seed_info) -> SeedConn:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(seed_info["host"], seed_info["port"]),
+            5.0)
+        writer.get_extra_info("socket").setsockopt(
+            socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        sc = SeedConn(reader, writer)
+        sc.task = asyncio.create_task(self._seed_conn_reader(sid, sc))
+        self._seed_conns[sid] = sc
+        return sc
+
+    def _dial_done(self, sid, task):
+        if self._seed_dials.get(sid) is task:
+            del self._seed_dials[sid]
+        if not task.cancelled():
+            task.exception()              # mark retrieved if nobody waited
+
+    async def _seed_conn_reader(self, sid, sc: SeedConn):
+        """Route replies on a pooled link to their waiting requests."""
+        buf = bytearray()
         try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.settimeout(timeout)
-            s.connect((seed_info["host"], seed_info["port"]))
-            s.sendall(message)
-            buf = b''
-            deadline = time.time() + timeout
-            while time.time() < deadline:
-                try:
-                    data = s.recv(4096)
-                    if not data:
-                        break
-                    buf += data
-                    msgs, buf = parse_messages(buf)
-                    responses.extend(msgs)
-                    if msgs:
-                        break
-                except socket.timeout:
+            while True:
+                data = await sc.reader.read(65536)
+                if not data:
                     break
-            s.close()
-        except (ConnectionRefusedError, socket.timeout, OSError) as e:
-            self.logger.warning(f"Cannot reach seed "
-                                f"{seed_info['host']}:{seed_info['port']}: {e}")
-        return responses
+                buf += data
+                msgs, buf = parse_messages(buf)
+                for m in msgs:
+                    p = m.get("payload", {})
+                    key = p.get("proposal_id") or p.get("sync_id")
+                    fut = sc.waiters.pop(key, None)
+                    if fut is not None and not fut.done():
+                        fut.set_result(m)
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self._drop_seed_conn(sid, sc)
+
+    def _drop_seed_conn(self, sid, sc: SeedConn):
+        if self._seed_conns.get(sid) is sc:
+            del self._seed_conns[sid]
+        sc.writer.close()
+        for fut in sc.waiters.values():
+            if not fut.done():
+                fut.set_exception(ConnectionResetError("seed link closed"))
+        sc.waiters.clear()
+
+    def _reap_seed_conns(self):
+        cutoff = time.monotonic() - SEED_CONN_IDLE
+        for sid, sc in list(self._seed_conns.items()):
+            if sc.last_used < cutoff and not sc.waiters:
+                self._drop_seed_conn(sid, sc)
+
+    async def _send_to_seed(self, seed_info, message: bytes,
+                            key=None, timeout=5.0):
+        """
+        Send on the pooled link.  With a key, wait for the reply that names
+        it and return it (None on timeout); a link that turns out to be dead
+        is replaced and the send retried once.
+        """
+        for attempt in (0, 1):
+            sc = None
+            try:
+                sc = await self._get_seed_conn(seed_info)
+                fut = None
+                if key is not None:
+                    fut = asyncio.get_running_loop().create_future()
+                    sc.waiters[key] = fut
+                sc.last_used = time.monotonic()
+                sc.writer.write(message)
+                await sc.writer.drain()
+                if fut is None:
+                    return None
+                try:
+                    return await asyncio.wait_for(fut, timeout)
+                except asyncio.TimeoutError:
+                    return None
+                finally:
+                    sc.waiters.pop(key, None)     # also on cancellation
+            except (asyncio.TimeoutError, OSError) as e:
+                # TimeoutError here can only come from connecting
+                if sc is not None:
+                    self._drop_seed_conn(
+                        peer_id(seed_info["host"], seed_info["port"]), sc)
+                if attempt or sc is None:
+                    self.logger.warning("Cannot reach seed %s:%s: %s",
+                                        seed_info["host"], seed_info["port"], e)
+                    return None
+        return None
+
+    async def _collect_votes(self, message: bytes, proposal_id, vote_type,
+                             label, timeout=5.0):
+        """
+        Ask every other seed at once and tally YES votes as they arrive;
+        stop waiting on the rest as soon as quorum is reached.
+        """
+        yes = self.proposals[proposal_id]["yes_count"]
+        if yes >= self.quorum:
+            return
+        tasks = [asyncio.create_task(
+                     self._send_to_seed(seed, message, proposal_id, timeout))
+                 for seed in self.other_seeds]
+        try:
+            for done in asyncio.as_completed(tasks):
+                resp = await done
+                if not resp or resp.get("type") != vote_type:
+                    continue
+                rp = resp["payload"]
+                if rp.get("proposal_id") == proposal_id and rp.get("vote"):
+                    voter = rp["voter"]
+                    yes = self._record_vote(
+                        self.proposals[proposal_id], voter, True)
+                    self.logger.info("%s from %s: YES  (total %d/%d)",
+                                     label, voter, yes, self.quorum)
+                    if yes >= self.quorum:
+                        break                     # ──► quorum reached
+        finally:
+            for t in tasks:
+                t.cancel()
 
     # ═════════════════════════════════════════════════════════════════════════
     # Registration Consensus
     # ═════════════════════════════════════════════════════════════════════════
 
-    def _on_register_request(self, payload, conn, addr):
+    async def _on_register_request(self, payload, conn, addr):
         """A peer wants to register — kick off seed consensus."""
         req_host = payload.get("host")
         req_port = payload.get("port")
         req_id   = peer_id(req_host, req_port)
 
         # Already registered — idempotent ACK
-        with self.peer_list_lock:
-            if req_id in self.peer_list:
-                self.logger.info(f"Peer {req_id} already registered — sending ACK")
-                try:
-                    conn.sendall(make_message(MSG_REGISTER_ACK, {
-                        "peer_id": req_id,
-                        "message": "Already registered"
-                    }))
-                except OSError:
-                    pass
-                return
+        if req_id in self.peer_list:
+            self.logger.info(f"Peer {req_id} already registered — sending ACK")
+            try:
+                await self._reply(conn, make_message(MSG_REGISTER_ACK, {
+                    "peer_id": req_id,
+                    "message": "Already registered"
+                }))
+            except OSError:
+                pass
+            return
 
         # Create proposal and self-vote
-        proposal_id = str(uuid.uuid4())[:8]
+        proposal_id = f"{self._pid_prefix}-{next(self._pid_counter)}"
         proposal = {
             "proposal_id": proposal_id,
             "type":  "register",
@@ -248,128 +401,117 @@ class SeedNode:
             "peer_id":   req_id,
             "proposer":  self.my_id,
             "votes":     {self.my_id: True},
+            "yes_count": 1,
             "decided":   False,
             "created":   time.time(),
         }
-        with self.proposals_lock:
-            self.proposals[proposal_id] = proposal
-        with self.pending_lock:
-            self.pending_responses[proposal_id] = (conn, addr)
+        self.proposals[proposal_id] = proposal
+        self.pending_responses[proposal_id] = (conn, addr)
 
         # ── LOG: Registration proposal ────────────────────────────────────
         self.logger.info(f"PROPOSAL: Register peer {req_id}  "
                          f"[id={proposal_id}, self-vote=YES, "
                          f"votes=1/{self.quorum} needed]")
 
-        # Collect votes from other seeds
-        yes = 1
-        for seed in self.other_seeds:
-            msg = make_message(MSG_PROPOSE_REGISTER, {
-                "proposal_id": proposal_id,
-                "peer_host": req_host,
-                "peer_port": req_port,
-                "peer_id":   req_id,
-                "proposer":  self.my_id,
-            })
-            for resp in self._send_to_seed_with_response(seed, msg, timeout=5.0):
-                if resp.get("type") == MSG_VOTE_REGISTER:
-                    rp = resp["payload"]
-                    if rp.get("proposal_id") == proposal_id and rp.get("vote"):
-                        voter = rp["voter"]
-                        with self.proposals_lock:
-                            self.proposals[proposal_id]["votes"][voter] = True
-                            yes = sum(
-                                1 for v in self.proposals[proposal_id]["votes"].values() if v
-                            )
-                        self.logger.info(f"Vote from {voter}: YES  "
-                                         f"(total {yes}/{self.quorum})")
+        # Collect votes from all other seeds at once
+        msg = make_message(MSG_PROPOSE_REGISTER, {
+            "proposal_id": proposal_id,
+            "peer_host": req_host,
+            "peer_port": req_port,
+            "peer_id":   req_id,
+            "proposer":  self.my_id,
+        })
+        await self._collect_votes(msg, proposal_id, MSG_VOTE_REGISTER, "Vote")
         # Decide
-        self._decide_registration(proposal_id)
+        await self._decide_registration(proposal_id)
 
-    def _on_propose_register(self, payload, conn):
+    async def _on_propose_register(self, payload, conn):
         """Another seed proposes registering a peer — vote and reply."""
         pid = payload["proposal_id"]
         req_id   = payload["peer_id"]
         proposer = payload["proposer"]
 
-        self.logger.info(f"Received registration proposal {pid} for "
-                         f"{req_id} from {proposer}")
+        self.logger.info("Received registration proposal %s for %s from %s",
+                         pid, req_id, proposer)
 
         vote = True          # always agree unless policy says otherwise
-        with self.peer_list_lock:
-            if req_id in self.peer_list:
-                vote = True  # idempotent
-
-        with self.proposals_lock:
-            if pid not in self.proposals:
-                self.proposals[pid] = {
-                    "proposal_id": pid,
-                    "type": "register",
-                    "peer_host": payload.get("peer_host"),
-                    "peer_port": payload.get("peer_port"),
-                    "peer_id": req_id,
-                    "proposer": proposer,
-                    "votes": {self.my_id: vote},
-                    "decided": False,
-                    "created": time.time(),
-                }
-        self.logger.info(f"Voting {'YES' if vote else 'NO'} on proposal {pid}")
+        if req_id in self.peer_list:
+            vote = True      # idempotent
+
+        if pid not in self.proposals:
+            self.proposals[pid] = {
+                "proposal_id": pid,
+                "type": "register",
+                "peer_host": payload.get("peer_host"),
+                "peer_port": payload.get("peer_port"),
+                "peer_id": req_id,
+                "proposer": proposer,
+                "votes": {self.my_id: vote},
+                "yes_count": int(vote),
+                "decided": False,
+                "created": time.time(),
+            }
+        self.logger.info("Voting %s on proposal %s", "YES" if vote else "NO", pid)
         try:
-            conn.sendall(make_message(MSG_VOTE_REGISTER, {
+            await self._reply(conn, make_message(MSG_VOTE_REGISTER, {
                 "proposal_id": pid,
                 "voter": self.my_id,
                 "vote": vote,
             }))
         except OSError as e:
-            self.logger.warning(f"Failed to send vote: {e}")
+            self.logger.warning("Failed to send vote: %s", e)
 
     def _on_vote_register(self, payload):
         pid   = payload.get("proposal_id")
         voter = payload.get("voter")
         vote  = payload.get("vote", False)
-        with self.proposals_lock:
-            if pid in self.proposals:
-                self.proposals[pid]["votes"][voter] = vote
-
-    def _decide_registration(self, proposal_id):
+        if pid in self.proposals:
+            self._record_vote(self.proposals[pid], voter, vote)
+
+    @staticmethod
+    def _record_vote(prop, voter, vote) -> int:
+        """Store one vote; return the proposal's YES total."""
+        prev = prop["votes"].get(voter, False)
+        prop["votes"][voter] = vote
+        prop["yes_count"] += bool(vote) - bool(prev)
+        return prop["yes_count"]
+
+    async def _decide_registration(self, proposal_id):
         """Decide based on collected votes (quorum check)."""
-        with self.proposals_lock:
-            prop = self.proposals.get(proposal_id)
-            if not prop or prop["decided"]:
-                return
-            yes = sum(1 for v in prop["votes"].values() if v)
-            total = len(prop["votes"])
-
-            if yes >= self.quorum:
-                prop["decided"] = True
-                approved = True
-            elif total >= self.total_seeds and yes < self.quorum:
-                prop["decided"] = True
-                approved = False
-            else:
-                # Degraded mode — accept with available votes
-                prop["decided"] = True
-                approved = yes >= self.quorum or yes >= 1
+        prop = self.proposals.get(proposal_id)
+        if not prop or prop["decided"]:
+            return
+        yes = prop["yes_count"]
+        total = len(prop["votes"])
+
+        if yes >= self.quorum:
+            prop["decided"] = True
+            approved = True
+        elif total >= self.total_seeds and yes < self.quorum:
+            prop["decided"] = True
+            approved = False
+        else:
+            # Degraded mode — accept with available votes
+            prop["decided"] = True
+            approved = yes >= self.quorum or yes >= 1
 
         req_id = prop["peer_id"]
 
         if approved:
-            with self.peer_list_lock:
-                self.peer_list[req_id] = {
-                    "host": prop["peer_host"],
-                    "port": prop["peer_port"],
-                    "joined": time.time(),
-                }
+            self._update_peers([("+", req_id, {
+                "host": prop["peer_host"],
+                "port": prop["peer_port"],
+                "joined": time.time(),
+            })])
             # ── LOG: Consensus outcome (approved) ─────────────────────────
             self.logger.info(f"CONSENSUS OUTCOME — APPROVED: Peer {req_id}  "
                              f"[votes={yes}/{total}, quorum={self.quorum}]")
             self.logger.info(f"Current Peer List: {list(self.peer_list.keys())}")
 
-            with self.pending_lock:
-                ci = self.pending_responses.pop(proposal_id, None)
+            ci = self.pending_responses.pop(proposal_id, None)
             if ci:
                 try:
-                    ci[0].sendall(make_message(MSG_REGISTER_ACK, {
+                    await self._reply(ci[0], make_message(MSG_REGISTER_ACK, {
                         "peer_id": req_id,
                         "message": f"Registration approved ({yes} votes)",
                     }))
@@ -379,11 +521,10 @@ class SeedNode:
             # ── LOG: Consensus outcome (rejected) ─────────────────────────
             self.logger.info(f"CONSENSUS OUTCOME — REJECTED: Peer {req_id}  "
                              f"[votes={yes}/{total}, quorum={self.quorum}]")
-            with self.pending_lock:
-                ci = self.pending_responses.pop(proposal_id, None)
+            ci = self.pending_responses.pop(proposal_id, None)
             if ci:
                 try:
-                    ci[0].sendall(make_message(MSG_REGISTER_NACK, {
+                    await self._reply(ci[0], make_message(MSG_REGISTER_NACK, {
                         "peer_id": req_id,
                         "message": "Registration rejected — quorum not met",
                     }))
@@ -394,7 +535,7 @@ class SeedNode:
     # Dead-Node Removal Consensus
     # ═════════════════════════════════════════════════════════════════════════
 
-    def _on_dead_node_report(self, payload, conn, addr):
+    async def _on_dead_node_report(self, payload, conn, addr):
         """
         A peer reports a dead node (already passed peer-level consensus).
         Initiate seed-level consensus before removing.
@@ -407,13 +548,12 @@ class SeedNode:
         self.logger.info(f"Dead-node report received: {raw_report}")
         self.logger.info(f"Reporter={reporter}, peer-level votes={peer_votes}")
 
-        with self.peer_list_lock:
-            if dead_id not in self.peer_list:
-                self.logger.warning(f"Dead node {dead_id} not in Peer List — ignoring")
-                return
+        if dead_id not in self.peer_list:
+            self.logger.warning(f"Dead node {dead_id} not in Peer List — ignoring")
+            return
 
         # Create removal proposal
-        proposal_id = str(uuid.uuid4())[:8]
+        proposal_id = f"{self._pid_prefix}-{next(self._pid_counter)}"
         proposal = {
             "proposal_id": proposal_id,
             "type": "remove",
@@ -422,64 +562,51 @@ class SeedNode:
             "peer_votes": peer_votes,
             "proposer": self.my_id,
             "votes": {self.my_id: True},
+            "yes_count": 1,
             "decided": False,
             "created": time.time(),
         }
-        with self.proposals_lock:
-            self.proposals[proposal_id] = proposal
+        self.proposals[proposal_id] = proposal
 
         # ── LOG: Removal proposal ─────────────────────────────────────────
         self.logger.info(f"PROPOSAL: Remove dead peer {dead_id}  "
                          f"[id={proposal_id}, reporter={reporter}]")
 
-        yes = 1
-        for seed in self.other_seeds:
-            msg = make_message(MSG_PROPOSE_REMOVE, {
-                "proposal_id": proposal_id,
-                "peer_id": dead_id,
-                "reporter": reporter,
-                "peer_votes": peer_votes,
-                "proposer": self.my_id,
-            })
-            for resp in self._send_to_seed_with_response(seed, msg, timeout=5.0):
-                if resp.get("type") == MSG_VOTE_REMOVE:
-                    rp = resp["payload"]
-                    if rp.get("proposal_id") == proposal_id and rp.get("vote"):
-                        voter = rp["voter"]
-                        with self.proposals_lock:
-                            self.proposals[proposal_id]["votes"][voter] = True
-                            yes = sum(
-                                1 for v in self.proposals[proposal_id]["votes"].values() if v
-                            )
-                        self.logger.info(f"Removal vote from {voter}: YES  "
-                                         f"(total {yes}/{self.quorum})")
+        msg = make_message(MSG_PROPOSE_REMOVE, {
+            "proposal_id": proposal_id,
+            "peer_id": dead_id,
+            "reporter": reporter,
+            "peer_votes": peer_votes,
+            "proposer": self.my_id,
+        })
+        await self._collect_votes(msg, proposal_id, MSG_VOTE_REMOVE,
+                                  "Removal vote")
         self._decide_removal(proposal_id)
 
-    def _on_propose_remove(self, payload, conn):
+    async def _on_propose_remove(self, payload, conn):
         pid      = payload["proposal_id"]
         dead_id  = payload["peer_id"]
         proposer = payload["proposer"]
 
-        self.logger.info(f"Received removal proposal {pid} for "
-                         f"{dead_id} from {proposer}")
+        self.logger.info("Received removal proposal %s for %s from %s",
+                         pid, dead_id, proposer)
         vote = True
-        with self.peer_list_lock:
-            if dead_id not in self.peer_list:
-                vote = False
-                self.logger.warning(f"Peer {dead_id} not in our list — voting NO")
-
-        with self.proposals_lock:
-            if pid not in self.proposals:
-                self.proposals[pid] = {
-                    "proposal_id": pid, "type": "remove",
-                    "peer_id": dead_id, "proposer": proposer,
-                    "peer_votes": payload.get("peer_votes", 0),
-                    "votes": {self.my_id: vote}, "decided": False,
-                    "created": time.time(),
-                }
-        self.logger.info(f"Voting {'YES' if vote else 'NO'} on removal {pid}")
+        if dead_id not in self.peer_list:
+            vote = False
+            self.logger.warning("Peer %s not in our list — voting NO", dead_id)
+
+        if pid not in self.proposals:
+            self.proposals[pid] = {
+                "proposal_id": pid, "type": "remove",
+                "peer_id": dead_id, "proposer": proposer,
+                "peer_votes": payload.get("peer_votes", 0),
+                "votes": {self.my_id: vote}, "yes_count": int(vote),
+                "decided": False,
+                "created": time.time(),
+            }
+        self.logger.info("Voting %s on removal %s", "YES" if vote else "NO", pid)
         try:
-            conn.sendall(make_message(MSG_VOTE_REMOVE, {
+            await self._reply(conn, make_message(MSG_VOTE_REMOVE, {
                 "proposal_id": pid,
                 "voter": self.my_id,
                 "vote": vote,
@@ -491,22 +618,19 @@ class SeedNode:
         pid = payload.get("proposal_id")
         voter = payload.get("voter")
         vote  = payload.get("vote", False)
-        with self.proposals_lock:
-            if pid in self.proposals:
-                self.proposals[pid]["votes"][voter] = vote
+        if pid in self.proposals:
+            self._record_vote(self.proposals[pid], voter, vote)
 
     def _decide_removal(self, proposal_id):
-        with self.proposals_lock:
-            prop = self.proposals.get(proposal_id)
-            if not prop or prop["decided"]:
-                return
-            yes = sum(1 for v in prop["votes"].values() if v)
-            prop["decided"] = True
+        prop = self.proposals.get(proposal_id)
+        if not prop or prop["decided"]:
+            return
+        yes = prop["yes_count"]
+        prop["decided"] = True
 
         dead_id = prop["peer_id"]
         if yes >= self.quorum:
-            with self.peer_list_lock:
-                removed = self.peer_list.pop(dead_id, None)
+            [(_, _, removed)] = self._update_peers([("-", dead_id, None)])
             if removed:
                 # ── LOG: Confirmed dead-node removal ──────────────────────
                 self.logger.info(f"CONFIRMED REMOVAL: Peer {dead_id} removed from "
@@ -522,56 +646,181 @@ class SeedNode:
     # Peer List Service
     # ═════════════════════════════════════════════════════════════════════════
 
-    def _on_get_peer_list(self, conn, addr):
-        with self.peer_list_lock:
-            pl = dict(self.peer_list)
-        self.logger.info(f"Sending Peer List ({len(pl)} peers) to {addr}")
-        try:
-            conn.sendall(make_message(MSG_PEER_LIST, {
+    async def _on_get_peer_list(self, conn, addr):
+        # Version first: a list newer than its tag only costs a rebuild
+        version = self.version
+        pl = self.peer_list
+        cached_version, reply = self._peer_list_cache
+        if cached_version != version:
+            reply = make_message(MSG_PEER_LIST, {
                 "peers": pl,
                 "seed_id": self.my_id,
-            }))
+            })
+            self._peer_list_cache = (version, reply)
+        self.logger.info("Sending Peer List (%d peers) to %s", len(pl), addr)
+        try:
+            await self._reply(conn, reply)
         except OSError as e:
-            self.logger.warning(f"Failed to send Peer List: {e}")
+            self.logger.warning("Failed to send Peer List: %s", e)
 
     # ═════════════════════════════════════════════════════════════════════════
     # Seed-to-Seed Synchronisation
     # ═════════════════════════════════════════════════════════════════════════
 
-    def _sync_loop(self):
+    async def _sync_loop(self):
         while self.running:
-            time.sleep(15)
-            self._sync_with_seeds()
+            await asyncio.sleep(15)
+            await self._sync_with_seeds()
+            self._reap_seed_conns()
+            self._expire_proposals()
 
-    def _sync_with_seeds(self):
-        with self.peer_list_lock:
-            my_peers = dict(self.peer_list)
-        for seed in self.other_seeds:
-            msg = make_message(MSG_SEED_SYNC, {
-                "peers": my_peers,
-                "sender": self.my_id,
-            })
-            for resp in self._send_to_seed_with_response(seed, msg, 3.0):
-                if resp.get("type") == MSG_SEED_SYNC:
-                    self._merge(resp.get("payload", {}).get("peers", {}))
+    def _expire_proposals(self):
+        """
+        Drop proposals older than PROPOSAL_TTL that are settled: decided
+        here, or another seed's proposal we only voted on.
+        """
+        cutoff = time.time() - PROPOSAL_TTL
+        stale = []
+        for pid, prop in self.proposals.items():
+            if prop["created"] >= cutoff:
+                break                         # insertion order ≈ age
+            if prop["decided"] or prop["proposer"] != self.my_id:
+                stale.append(pid)
+        for pid in stale:
+            del self.proposals[pid]
+
+    def _update_peers(self, ops) -> list:
+        """
+        Apply ops decided by this seed to a copy of the Peer List, publish
+        it and log them for delta sync; returns (op, peer_id, changed) per
+        op, as from _apply_op.  Merged ops go through _merge instead: their
+        origin seed already ships them to every other seed.
+        """
+        peers = dict(self.peer_list)
+        changed = [(op, pid, self._apply_op(peers, op, pid, info))
+                   for op, pid, info in ops]
+        self.peer_list = peers
+        return changed
 
-    def _on_seed_sync(self, payload):
-        self._merge(payload.get("peers", {}))
+    def _apply_op(self, peers, op, pid, info=None):
+        """
+        Add ("+") or remove ("-") one peer in the working copy `peers`.
+        Returns the entry added or removed, or None if nothing changed.
+        """
+        if op == "+":
+            peers[pid] = info
+            changed = info
+        else:
+            changed = peers.pop(pid, None)
+            if changed is None:
+                return None
+        self.version += 1
+        self._ops.append((self.version, op, pid, info))
+        if len(self._ops) > SYNC_LOG_MAX:
+            drop = len(self._ops) - SYNC_LOG_MAX
+            self._ops_floor = self._ops[drop - 1][0]
+            del self._ops[:drop]
+        return changed
+
+    def _ops_since(self, since):
+        """Delta after `since`, or a full snapshot if the log was trimmed."""
+        if since < self._ops_floor:
+            return True, [["+", pid, info]
+                          for pid, info in self.peer_list.items()]
+        return False, [[op, pid, info]
+                       for v, op, pid, info in self._ops if v > since]
+
+    async def _sync_with_seeds(self):
+        # Seeds that acked the same version get the very same delta, so
+        # each distinct `since` is encoded once and its bytes shared.
+        upto = self._ops[-1][0] if self._ops else self._ops_floor
+        frames = {}
+        for seed in self.other_seeds:
+            since = self._last_sent_version.get(
+                peer_id(seed["host"], seed["port"]), 0)
+            if since not in frames:
+                full, ops = self._ops_since(since)
+                frames[since] = make_message(MSG_SEED_SYNC, {
+                    "sync_id": f"{self.my_id}:{upto}",
+                    "sender":  self.my_id,
+                    "epoch":   self._epoch,
+                    "since":   since,
+                    "upto":    upto,
+                    "full":    full,
+                    "ops":     ops,
+                })
+        await asyncio.gather(*(self._sync_one(seed, frames, upto)
+                               for seed in self.other_seeds))
+
+    async def _sync_one(self, seed, frames, upto):
+        sid = peer_id(seed["host"], seed["port"])
+        msg = frames[self._last_sent_version.get(sid, 0)]
+        # Sent even when empty: the ack tells us if the receiver restarted
+        resp = await self._send_to_seed(seed, msg, f"{self.my_id}:{upto}", 3.0)
+        if resp and resp.get("type") == MSG_SEED_SYNC:
+            p = resp["payload"]
+            ack = p.get("ack")
+            if (isinstance(ack, int) and 0 <= ack <= upto
+                    and p.get("epoch") == self._epoch):
+                self._last_sent_version[sid] = ack
+            else:
+                # An ack for another boot of ours, or beyond what we have:
+                # start this seed over from a complete sync.
+                self._last_sent_version.pop(sid, None)
+
+    async def _on_seed_sync(self, payload, conn):
+        """Apply another seed's delta if it continues from what we hold."""
+        sender = payload.get("sender")
+        epoch  = payload.get("epoch")
+        seen_epoch, have = self._applied_version.get(sender, (None, 0))
+        if epoch != seen_epoch:
+            have = 0                  # sender restarted: its versions began anew
+        upto   = payload.get("upto", 0)
+        if payload.get("full") or payload.get("since") == have:
+            self._merge(payload.get("ops", []))
+            have = upto
+        self._applied_version[sender] = (epoch, have)
+        try:
+            await self._reply(conn, make_message(MSG_SEED_SYNC, {
+                "sync_id": payload.get("sync_id"),
+                "sender":  self.my_id,
+                "epoch":   epoch,
+                "ack":     have,
+            }))
+        except OSError:
+            pass
 
-    def _merge(self, remote: dict):
-        with self.peer_list_lock:
-            for pid, info in remote.items():
-                if pid not in self.peer_list:
-                    self.peer_list[pid] = info
-                    self.logger.info(f"Merged peer {pid} from seed sync")
+    def _merge(self, ops: list):
+        """Apply another seed's ops in bulk; merges never overwrite."""
+        final = {pid: (op, info[0] if info else None)
+                 for op, pid, *info in ops}       # last op per peer wins
+        peers = self.peer_list
+        added = {pid: info for pid, (op, info) in final.items()
+                 if op == "+" and pid not in peers}
+        removed = [pid for pid, (op, _) in final.items()
+                   if op == "-" and pid in peers]
+        if not added and not removed:
+            return
+        peers = dict(peers)
+        peers.update(added)
+        for pid in removed:
+            del peers[pid]
+        self.version += len(added) + len(removed)
+        self.peer_list = peers
+        self.logger.info("Seed sync: merged %d peers, removed %d",
+                         len(added), len(removed))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            for pid in added:
+                self.logger.debug("Merged peer %s via seed sync", pid)
+            for pid in removed:
+                self.logger.debug("Removed peer %s via seed sync", pid)
 
     # ═════════════════════════════════════════════════════════════════════════
     # Status helper
     # ═════════════════════════════════════════════════════════════════════════
 
     def get_status(self) -> dict:
-        with self.peer_list_lock:
-            peers = list(self.peer_list.keys())
+        peers = list(self.peer_list)
         return {
             "seed_id": self.my_id,
             "peers": peers,
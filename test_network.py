@@ -13,12 +13,14 @@ Usage:
     python3 test_network.py
 """
 
-import os, socket, subprocess, sys, time
+import logging, os, socket, subprocess, sys, threading, time
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from protocol import (
-    make_message, parse_messages,
+    make_message, parse_messages, FRAME_HEADER,
+    FrameError, MAX_MESSAGE_SIZE,
     MSG_REGISTER_REQUEST, MSG_REGISTER_ACK,
     MSG_GET_PEER_LIST, MSG_PEER_LIST,
     MSG_GOSSIP, MSG_DEAD_NODE_REPORT,
@@ -27,6 +29,33 @@ from protocol import (
 
 DIR = os.path.dirname(os.path.abspath(__file__))
 CFG = os.path.join(DIR, "config.txt")
+OUT = os.path.join(DIR, "outputfile.txt")
+
+# Socket constructor and constants, bound once for the probe helpers
+_sock, _AF, _ST = socket.socket, socket.AF_INET, socket.SOCK_STREAM
+
+# ── child processes ───────────────────────────────────────────────────────
+# One /dev/null shared by every child.  Python opens its own fds
+# non-inheritable, so on POSIX skipping the close_fds sweep leaks nothing;
+# a new session keeps terminal signals away from the children (cleanup()
+# stops them).
+DEVNULL  = open(os.devnull, "wb")
+SPAWN_KW = dict(stdout=DEVNULL, stderr=DEVNULL)
+if os.name == "posix":
+    SPAWN_KW.update(close_fds=False, start_new_session=True)
+
+# ── fixed probe frames (encoded once, resent as-is) ───────────────────────
+PEER_LIST_PROBE = make_message(MSG_GET_PEER_LIST, {})
+REG_7000        = make_message(MSG_REGISTER_REQUEST,
+                               {"host":"127.0.0.1","port":7000})
+FALSE_DEAD_REPORT = make_message(MSG_DEAD_NODE_REPORT, {
+    "dead_peer_id":"127.0.0.1:9999",
+    "reporter_id":"127.0.0.1:7000",
+    "peer_votes":1,
+    "report_string":"Dead Node:127.0.0.1:9999:0:127.0.0.1",
+})
+# An out-of-range length prefix with a valid request right behind it
+BOGUS_THEN_PROBE = FRAME_HEADER.pack(MAX_MESSAGE_SIZE + 1) + PEER_LIST_PROBE
 
 # ── colours ───────────────────────────────────────────────────────────────
 G='\033[92m'; R='\033[91m'; Y='\033[93m'; C='\033[96m'; B='\033[1m'; X='\033[0m'
@@ -38,54 +67,192 @@ def fail(t): print(f"  {R}✗ FAIL{X}: {t}")
 def info(t): print(f"  {Y}ℹ{X} {t}")
 
 
+class ConnPool:
+    """
+    Keep-alive sockets to the seeds, reused across send_recv calls.
+    Each thread gets its own, so overlapping stages never share a stream.
+    """
+    def __init__(self):
+        self.conns = {}
+
+    def get(self, host, port, timeout):
+        """(socket, reused) — an open pooled socket or a fresh one."""
+        key = (host, port, threading.get_ident())
+        s = self.conns.get(key)
+        if s is not None:
+            return s, True
+        s = socket.create_connection((host, port), timeout)
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.conns[key] = s
+        return s, False
+
+    def drop(self, host, port):
+        s = self.conns.pop((host, port, threading.get_ident()), None)
+        if s is not None: s.close()
+
+    def close_all(self):
+        for s in list(self.conns.values()): s.close()
+        self.conns.clear()
+
+POOL = ConnPool()
+
+
 def send_recv(host, port, msg, timeout=10):
+    """
+    Send one request on the pooled connection and return the first batch
+    of replies.  A pooled socket the seed has since closed is replaced and
+    the request retried once; a connection left with no reply or with a
+    partial frame is dropped so stale bytes never answer a later request.
+    """
+    return _exchange(host, port, msg, 1, timeout)
+
+
+def send_recv_batch(host, port, msgs, timeout=10):
+    """
+    Pipeline several requests in one write and collect a reply for each.
+    The seed handles a connection's frames in order, so replies come back
+    in request order.
+    """
+    return _exchange(host, port, b"".join(msgs), len(msgs), timeout)
+
+
+def _exchange(host, port, data, want, timeout):
+    """Write data on the pooled connection; read until want replies."""
     resp = []
+    for _ in range(2):
+        try:
+            s, reused = POOL.get(host, port, timeout)
+        except OSError:
+            return resp
+        # Replies land in place via recv_into and are parsed through a
+        # view from the first byte not yet consumed (done).  Once a frame's
+        # length prefix is in, nothing is parsed until the whole frame
+        # (need) has arrived, and the buffer grows straight to fit it.
+        buf = bytearray(65536); pos = done = rest = 0
+        need = FRAME_HEADER.size
+        try:
+            s.settimeout(timeout)
+            s.sendall(data)
+            now = time.monotonic_ns
+            dl = now() + int(timeout * 1e9)
+            while now() < dl:
+                if need > len(buf) or pos == len(buf):
+                    buf.extend(bytes(max(need, 2 * len(buf)) - len(buf)))
+                with memoryview(buf) as view:
+                    n = s.recv_into(view[pos:])
+                    if not n: break
+                    pos += n
+                    if pos < need: continue
+                    ms, rest = parse_messages(view[done:pos])
+                    resp.extend(ms)
+                    rest = len(rest); done = pos - rest
+                    need = done + FRAME_HEADER.size
+                    if rest >= FRAME_HEADER.size:
+                        need += FRAME_HEADER.unpack_from(view, done)[0]
+                if len(resp) >= want: break
+        except OSError:                  # includes socket.timeout
+            pass
+        if resp and not rest:
+            return resp
+        POOL.drop(host, port)
+        if resp or not reused:
+            return resp
+    return resp
+
+
+def _send_frame(port, frame, timeout=3):
+    """Fire one frame at a local node on a fresh connection; True if sent."""
     try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        s.settimeout(timeout)
-        s.connect((host, port))
-        s.sendall(msg)
-        buf = b''
-        dl = time.time() + timeout
-        while time.time() < dl:
-            try:
-                d = s.recv(4096)
-                if not d: break
-                buf += d
-                ms, buf = parse_messages(buf)
-                resp.extend(ms)
-                if ms: break
-            except socket.timeout:
-                break
+        s = _sock(_AF, _ST)
+        s.settimeout(timeout); s.connect(("127.0.0.1",port))
+        s.sendall(frame)
         s.close()
-    except (ConnectionRefusedError, socket.timeout, OSError):
-        pass
-    return resp
+        return True
+    except OSError:                      # includes socket.timeout
+        return False
 
 
 def wait_port(host, port, timeout=10):
-    dl = time.time() + timeout
-    while time.time() < dl:
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.settimeout(1); s.connect((host, port)); s.close()
-            return True
-        except:
-            time.sleep(0.3)
+    """
+    Poll until host:port accepts a connection.  Retries back off from
+    10 ms to 200 ms, so a port that comes up quickly is seen quickly.
+    """
+    now = time.monotonic_ns
+    dl = now() + int(timeout * 1e9)
+    delay = 0.01
+    while now() < dl:
+        # connect_ex reports a refusal as an errno instead of raising;
+        # the socket timeout bounds a connect that neither lands nor fails.
+        with _sock(_AF, _ST) as s:
+            s.settimeout(1)
+            if s.connect_ex((host, port)) == 0:
+                return True
+        time.sleep(delay)
+        delay = min(delay * 2, 0.2)
     return False
 
 
+def wait_until(pred, timeout, interval=0.05):
+    """Poll pred() until it holds or timeout expires; True if it held."""
+    now = time.monotonic_ns
+    dl = now() + int(timeout * 1e9)
+    while not pred():
+        if now() >= dl:
+            return False
+        time.sleep(interval)
+    return True
+
+
+def get_peer_list(port=6000, timeout=5):
+    """Peer List held by the seed on port, or None if it did not answer."""
+    r = send_recv("127.0.0.1", port, PEER_LIST_PROBE, timeout)
+    if r and r[0].get("type") == MSG_PEER_LIST:
+        return r[0]["payload"].get("peers",{})
+    return None
+
+
+def log_size():
+    try: return os.path.getsize(OUT)
+    except OSError: return 0
+
+
+def log_lines():
+    """Line count of outputfile.txt, counted 1 MiB at a time."""
+    with open(OUT, "rb") as f:
+        return sum(b.count(b"\n") for b in iter(lambda: f.read(1 << 20), b""))
+
+
+def logged_since(offset, needle):
+    """True once needle appears in outputfile.txt after byte offset."""
+    try:
+        with open(OUT, "rb") as f:
+            f.seek(offset); return needle in f.read()
+    except OSError:
+        return False
+
+
 class TestSuite:
     def __init__(self):
         self.seeds = []; self.peers = []
         self.p = 0; self.f = 0
+        self.log_mark = log_size()     # only count log lines from this run
+        self.removal_wait = None       # stage 5's background poll
+        self.removal_pl   = None       # ...and the last Peer List it saw
 
     def cleanup(self):
-        for proc in self.peers + self.seeds:
-            try: proc.terminate(); proc.wait(3)
-            except:
-                try: proc.kill()
-                except: pass
+        POOL.close_all()
+        procs = self.peers + self.seeds
+        # Signal everyone first so the shutdowns overlap, then give the
+        # whole group one shared 3 s grace before killing stragglers.
+        for proc in procs:
+            try: proc.terminate()
+            except OSError: pass
+        dl = time.monotonic() + 3
+        for proc in procs:
+            try: proc.wait(max(0, dl - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                try: proc.kill(); proc.wait()
+                except OSError: pass
         self.peers.clear(); self.seeds.clear()
 
     def check(self, cond, msg):
@@ -99,11 +266,11 @@ class TestSuite:
         proc = subprocess.Popen(
             [sys.executable, os.path.join(DIR, "seed.py"),
              "--host","127.0.0.1","--port","6000","--config",CFG],
-            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        self.seeds.append(proc); time.sleep(1)
+            **SPAWN_KW)
+        self.seeds.append(proc)
         self.check(wait_port("127.0.0.1",6000,5),
                    "Seed node accepts TCP connections")
-        r = send_recv("127.0.0.1",6000, make_message(MSG_GET_PEER_LIST,{}), 5)
+        r = send_recv("127.0.0.1",6000, PEER_LIST_PROBE, 5)
         self.check(len(r) > 0, "Seed node responds to messages")
         if r:
             self.check(r[0].get("type") == MSG_PEER_LIST,
@@ -117,25 +284,27 @@ class TestSuite:
             proc = subprocess.Popen(
                 [sys.executable, os.path.join(DIR, "seed.py"),
                  "--host","127.0.0.1","--port",str(p),"--config",CFG],
-                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                **SPAWN_KW)
             self.seeds.append(proc)
-        time.sleep(2)
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            list(ex.map(lambda p: wait_port("127.0.0.1",p,5), [6001, 6002]))
         info("3 seeds running on 6000-6002")
 
-        # Register peer via seed consensus
-        r = send_recv("127.0.0.1",6000,
-                      make_message(MSG_REGISTER_REQUEST,
-                                   {"host":"127.0.0.1","port":7000}), 15)
+        # Register peer via seed consensus, fetching the Peer List in the
+        # same round trip (the seed answers it once the vote is decided)
+        r = send_recv_batch("127.0.0.1",6000, [REG_7000, PEER_LIST_PROBE], 15)
         ack = any(x.get("type") == MSG_REGISTER_ACK for x in r)
         self.check(ack, "Peer registration approved via seed consensus")
         if ack:
             info(f"Msg: {r[0]['payload'].get('message','')}")
 
         # Verify in peer list
-        time.sleep(1)
-        r = send_recv("127.0.0.1",6000, make_message(MSG_GET_PEER_LIST,{}), 5)
-        if r and r[0].get("type") == MSG_PEER_LIST:
-            peers = r[0]["payload"].get("peers",{})
+        peers = next((x["payload"].get("peers",{}) for x in r
+                      if x.get("type") == MSG_PEER_LIST), None)
+        if peers is None or "127.0.0.1:7000" not in peers:
+            wait_until(lambda: "127.0.0.1:7000" in (get_peer_list() or {}), 5)
+            peers = get_peer_list()
+        if peers is not None:
             self.check("127.0.0.1:7000" in peers,
                        "Registered peer appears in seed's Peer List")
             info(f"PL: {list(peers.keys())}")
@@ -151,18 +320,25 @@ class TestSuite:
 
     def stage3(self):
         header("Stage 3: Overlay Formation & Power-Law Topology")
+        # Each peer must be registered before the next one starts, or the
+        # later peers fetch a Peer List without it and the overlay thins
+        # out — so start them one by one, but only wait until each is up.
         for p in range(7000, 7005):
             proc = subprocess.Popen(
                 [sys.executable, os.path.join(DIR, "peer.py"),
                  "--host","127.0.0.1","--port",str(p),"--config",CFG],
-                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            self.peers.append(proc); time.sleep(1.5)
+                **SPAWN_KW)
+            self.peers.append(proc)
+            wait_until(lambda: logged_since(
+                self.log_mark, f"[PEER:{p}] INFO - Peer node fully active".encode()),
+                1.5, interval=0.05)
         info("5 peers starting on 7000-7004")
-        time.sleep(3)
+        # Seed 6000 only hears directly from peers that picked it; the rest
+        # arrive with the next seed sync (every 15 s)
+        wait_until(lambda: len(get_peer_list() or {}) >= 3, 20, interval=0.2)
+        peers = get_peer_list()
 
-        r = send_recv("127.0.0.1",6000, make_message(MSG_GET_PEER_LIST,{}), 5)
-        if r and r[0].get("type") == MSG_PEER_LIST:
-            peers = r[0]["payload"].get("peers",{})
+        if peers is not None:
             info(f"Peers in seed PL: {len(peers)} — {list(peers.keys())}")
             self.check(len(peers) >= 3,
                        f"At least 3 peers registered (got {len(peers)})")
@@ -177,35 +353,27 @@ class TestSuite:
 
     def stage4(self):
         header("Stage 4: Gossip Dissemination (max 10 msgs, dedup)")
-        info("Waiting for gossip propagation (~8 s)…")
-        time.sleep(8)
+        info("Waiting for gossip propagation (≤ 8 s)…")
+        wait_until(lambda: logged_since(self.log_mark, b"Gossip received"),
+                   8, interval=0.2)
 
         # Send a test gossip
         ts = time.time()
         mid = gossip_message_id(ts, "127.0.0.1", 9999, 999)
         mh  = hash_message(mid)
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.settimeout(3); s.connect(("127.0.0.1",7000))
-            s.sendall(make_message(MSG_GOSSIP, {
-                "msg_id": mid, "msg_hash": mh, "sender": "test",
-            }))
-            s.close()
+        frame = make_message(MSG_GOSSIP, {
+            "msg_id": mid, "msg_hash": mh, "sender": "test",
+        })
+        if _send_frame(7000, frame):
             ok("Gossip message accepted by peer"); self.p += 1
-        except:
+        else:
             fail("Could not send gossip"); self.f += 1
 
-        # Duplicate — should be silently ignored
+        # Duplicate — the very same bytes, should be silently ignored
         time.sleep(1)
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.settimeout(3); s.connect(("127.0.0.1",7000))
-            s.sendall(make_message(MSG_GOSSIP, {
-                "msg_id": mid, "msg_hash": mh, "sender": "test",
-            }))
-            s.close()
+        if _send_frame(7000, frame):
             ok("Duplicate gossip handled (no error)"); self.p += 1
-        except:
+        else:
             fail("Error on duplicate gossip"); self.f += 1
 
     # ── Stage 5 ──────────────────────────────────────────────────────────
@@ -218,19 +386,37 @@ class TestSuite:
         info("Terminating peer on port 7004…")
         victim.terminate()
         try: victim.wait(3)
-        except: victim.kill()
+        except subprocess.TimeoutExpired: victim.kill()
         self.peers.pop()
 
-        time.sleep(1)
         self.check(not wait_port("127.0.0.1",7004,2),
                    "Peer 7004 confirmed unreachable")
 
-        info("Waiting for liveness detection (~20 s)…")
-        time.sleep(20)
-
-        r = send_recv("127.0.0.1",6000, make_message(MSG_GET_PEER_LIST,{}), 5)
-        if r and r[0].get("type") == MSG_PEER_LIST:
-            peers = r[0]["payload"].get("peers",{})
+        # Detection takes a few liveness rounds; wait for it in the
+        # background while stage 6 runs, and report in stage5_finish().
+        info("Waiting for liveness detection (≤ 20 s, overlapped with stage 6)…")
+        def removed():
+            pl = get_peer_list()
+            if pl is None:
+                return False
+            self.removal_pl = pl
+            return "127.0.0.1:7004" not in pl
+        self.removal_wait = threading.Thread(
+            target=wait_until, args=(removed, 20, 0.5), daemon=True)
+        self.removal_wait.start()
+
+    def stage5_finish(self):
+        if self.removal_wait is None:
+            return
+        self.removal_wait.join()
+        header("Stage 5 (cont.): Dead-Node Removal")
+        # The poll stops on the first list without 7004, so its last
+        # sample is the verdict; probe again only if it never got one.
+        peers = self.removal_pl
+        if peers is None:
+            peers = get_peer_list()
+
+        if peers is not None:
             if "127.0.0.1:7004" not in peers:
                 ok("Dead peer 7004 removed from seed PL"); self.p += 1
             else:
@@ -242,27 +428,78 @@ class TestSuite:
     def stage6(self):
         header("Stage 6: Security Testing")
         # False dead-node report for non-existent peer
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.settimeout(5); s.connect(("127.0.0.1",6000))
-            s.sendall(make_message(MSG_DEAD_NODE_REPORT, {
-                "dead_peer_id":"127.0.0.1:9999",
-                "reporter_id":"127.0.0.1:7000",
-                "peer_votes":1,
-                "report_string":"Dead Node:127.0.0.1:9999:0:127.0.0.1",
-            }))
-            s.close()
+        if _send_frame(6000, FALSE_DEAD_REPORT, 5):
             ok("False report for unknown peer handled gracefully"); self.p+=1
-        except:
+        else:
             fail("Could not send false report"); self.f += 1
 
         # Idempotent re-registration
-        r = send_recv("127.0.0.1",6000,
-                      make_message(MSG_REGISTER_REQUEST,
-                                   {"host":"127.0.0.1","port":7000}), 10)
+        r = send_recv("127.0.0.1",6000, REG_7000, 10)
         self.check(any(x.get("type")==MSG_REGISTER_ACK for x in r),
                    "Re-registration returns ACK (idempotent)")
 
+        # A bad length header cannot be resynced past: the parser must
+        # say so, and the seed must hang up rather than read body bytes
+        # as the next header.
+        try: parse_messages(bytearray(BOGUS_THEN_PROBE)); desync = False
+        except FrameError: desync = True
+        self.check(desync, "Parser reports a bogus length header")
+        replies, closed = [], False
+        try:
+            with socket.create_connection(("127.0.0.1",6000), 5) as s:
+                s.settimeout(5)
+                s.sendall(BOGUS_THEN_PROBE)
+                buf = bytearray()
+                while True:
+                    data = s.recv(4096)
+                    if not data: closed = True; break
+                    buf += data
+                    ms, buf = parse_messages(buf); replies += ms
+        except OSError:
+            pass
+        self.check(closed and not replies,
+                   "Seed closes a connection with a bogus length header")
+        self.check(len(send_recv("127.0.0.1",6000, PEER_LIST_PROBE, 5)) > 0,
+                   "Seed still serves new connections afterwards")
+
+        self.forged_ihave()
+
+    def forged_ihave(self):
+        """A GOSSIP frame's IHAVE list must not stop a relay to a neighbor."""
+        from peer import PeerNode, IHAVE_MAX
+        logging.getLogger("Peer-7990").disabled = True   # keep output clean
+        node = PeerNode("127.0.0.1", 7990, CFG)
+        sender, nbr = "127.0.0.1:7991", "127.0.0.1:7992"
+        forged = [f"127.0.0.1:{8000+i}" for i in range(IHAVE_MAX)]
+        with _sock(_AF, _ST) as srv:
+            srv.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            srv.bind(("127.0.0.1", 7992)); srv.listen(1); srv.settimeout(5)
+            with node.neighbors_lock:
+                node.neighbors = {pid: {"host": "127.0.0.1",
+                                        "port": int(pid.rsplit(":", 1)[1])}
+                                  for pid in (sender, nbr)}
+                node._publish_neighbors()
+            node._on_gossip({"msg_id": "0:127.0.0.1:7991:1",
+                             "sender": sender, "seen": forged}, None)
+            got = []
+            try:
+                conn, _ = srv.accept(); conn.settimeout(5)
+                with conn:
+                    buf = bytearray()
+                    while not got:
+                        data = conn.recv(4096)
+                        if not data: break
+                        buf += data
+                        got, buf = parse_messages(buf)
+            except OSError:
+                pass
+        node.stop()
+        self.check(any(m.get("type") == MSG_GOSSIP for m in got),
+                   "Forged IHAVE list does not stop forwarding to a neighbor")
+        seen = got[0].get("payload", {}).get("seen", []) if got else []
+        self.check(bool(got) and not set(forged) & set(seen),
+                   "Forged IHAVE ids are not relayed onward")
+
     # ── Run all ──────────────────────────────────────────────────────────
 
     def run(self):
@@ -276,6 +513,7 @@ class TestSuite:
             self.stage4()
             self.stage5()
             self.stage6()
+            self.stage5_finish()
         except Exception as e:
             print(f"\n{R}ERROR: {e}{X}")
             import traceback; traceback.print_exc()
@@ -286,10 +524,8 @@ class TestSuite:
             print(f"  {R}Failed: {self.f}{X}")
             print(f"  Total:  {tot}\n")
             # Verify outputfile.txt was created
-            out = os.path.join(DIR, "outputfile.txt")
-            if os.path.exists(out):
-                lines = sum(1 for _ in open(out))
-                ok(f"outputfile.txt exists ({lines} lines)")
+            if os.path.exists(OUT):
+                ok(f"outputfile.txt exists ({log_lines()} lines)")
             else:
                 fail("outputfile.txt was NOT created")
             info("Cleaning up…"); self.cleanup(); info("Done.\n")
@@ -18,11 +18,13 @@ Usage:
     python3 visualizer.py
 """
 
+import heapq
+import itertools
 import math
 import random
+import time
 import tkinter as tk
-from tkinter import ttk
-from collections import defaultdict
+from collections import defaultdict, deque
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  THEME
@@ -49,9 +51,22 @@ BUTTON_BG    = "#313244"
 BUTTON_FG    = "#cdd6f4"
 PROGRESS_FG  = "#89b4fa"
 
+# Peer (fill, stroke) by status
+PEER_STYLE = {
+    "alive":   (PEER_FILL, PEER_STROKE),
+    "dead":    (PEER_DEAD, DEAD_STROKE),
+    "removed": ("#45475a", "#585b70"),
+}
+
+# Edge option sets passed to itemconfigure as one prebuilt cnf dict
+EDGE_CFG_NORMAL = {"fill": EDGE_NORMAL, "width": 1}
+EDGE_CFG_GOSSIP = {"fill": EDGE_GOSSIP, "width": 2.5}
+EDGE_CFG_PING   = {"fill": EDGE_PING, "width": 2, "dash": (4, 4)}
+
 ANIM_SLOW  = 1200   # ms for slow steps
 ANIM_MED   = 700
 ANIM_FAST  = 400
+FRAME_MS   = 16     # message-ball tick (~60 fps)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -63,10 +78,14 @@ class SimNode:
         self.nid = nid
         self.ntype = ntype       # "seed" or "peer"
         self.port = port
+        self.label = (f"S{port - 5999}" if ntype == "seed"
+                      else f"P{port - 6999}")
+        self.port_label = f":{port}"
         self.x = x
         self.y = y
         self.status = "alive"    # alive, dead, removed
-        self.neighbors = []
+        self.neighbors = {}      # ordered set of chosen nids (dict keys)
+        self.rev_neighbors = []  # nids that chose this node, in port order
         self.gossip_seen = set()
         self.gossip_count = 0
         self.canvas_ids = []
@@ -74,10 +93,13 @@ class SimNode:
 
 
 class SimEdge:
-    def __init__(self, a, b):
-        self.a = a
-        self.b = b
+    def __init__(self, node_a: SimNode, node_b: SimNode):
+        self.node_a = node_a
+        self.node_b = node_b
+        self.a = node_a.nid      # endpoint ids, for matching against nids
+        self.b = node_b.nid
         self.canvas_id = None
+        self.drawn_at = None     # line coords last sent to the canvas
 
 
 class Simulation:
@@ -86,11 +108,24 @@ class Simulation:
         self.num_peers = num_peers
         self.seeds: dict[str, SimNode] = {}
         self.peers: dict[str, SimNode] = {}
-        self.edges: list[SimEdge] = []
+        # Nodes in port order (= insertion order), filled once at start
+        self.seed_list: list[SimNode] = []
+        self.peer_list: list[SimNode] = []
+        # Peers still alive, in port order; a crash drops its node here
+        self.alive_peers: list[SimNode] = []
+        # Every edge by endpoint pair, in creation order:
+        # {frozenset((nid, nid)): SimEdge}
+        self.edge_index: dict[frozenset, SimEdge] = {}
         self.quorum = num_seeds // 2 + 1
+        self.total_gossip = 0    # sum of every peer's gossip_count
         self.phase = 0
         self.step = 0
 
+    @property
+    def edges(self):
+        """All edges in creation order (a live view of edge_index)."""
+        return self.edge_index.values()
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  MAIN GUI
@@ -116,9 +151,21 @@ class VisualizerApp:
         self.root.minsize(1000, 650)
 
         self.sim: Simulation | None = None
-        self._anim_queue: list = []
+        self._anim_queue: deque = deque()
         self._anim_running = False
-        self._speed = 1.0
+        self._speed = 1.0                # mirrors speed_scale
+        self._delay_cache: dict = {}     # delay factor -> ms at _speed
+        self._active_balls: list = []    # [tag, dx, dy, steps_left, callback]
+        self._ball_ids = 0
+        self._badge_ids = 0
+        self._tick_id = None
+        self._tick_at = 0.0              # monotonic time the tick is due
+        self._timers: list = []          # heap of (due, seq, fn, args)
+        self._timer_seq = itertools.count()
+        self._cw = self._ch = 0          # canvas size, kept by <Configure>
+        self._visible = True             # False while the window is iconified
+        self._log_buffer: list = []      # text, tag, text, tag, … to insert
+        self._log_flush_id = None
 
         self._build_ui()
 
@@ -148,6 +195,9 @@ class VisualizerApp:
         body.add(canvas_frame, width=820)
         self.canvas = tk.Canvas(canvas_frame, bg=BG_PANEL, highlightthickness=0)
         self.canvas.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
+        self.canvas.bind("<Configure>", self._on_canvas_resize)
+        self.root.bind("<Map>", self._on_map)
+        self.root.bind("<Unmap>", self._on_map)
 
         # Right panel
         right = tk.Frame(body, bg=BG)
@@ -198,7 +248,8 @@ class VisualizerApp:
                                     bg=BG_CARD, fg=FG, troughcolor=BG_PANEL,
                                     highlightthickness=0, bd=0,
                                     activebackground=ACCENT,
-                                    font=("Consolas", 9))
+                                    font=("Consolas", 9),
+                                    command=self._on_speed)
         self.speed_scale.set(1.0)
         self.speed_scale.pack(side=tk.LEFT, padx=4)
         tk.Label(row3, text="x", font=("Consolas", 9),
@@ -286,15 +337,40 @@ class VisualizerApp:
 
     # ── Helpers ──────────────────────────────────────────────────────
 
+    def _on_speed(self, value):
+        """Slider moved: cache the new speed and drop stale delays."""
+        self._speed = float(value)
+        self._delay_cache.clear()
+
     def _delay(self, factor=1.0):
         """Return adjusted delay in ms based on speed slider."""
-        return max(50, int(ANIM_MED * factor / self.speed_scale.get()))
+        ms = self._delay_cache.get(factor)
+        if ms is None:
+            ms = self._delay_cache[factor] = max(
+                50, int(ANIM_MED * factor / self._speed))
+        return ms
 
     def _log(self, text, tag="info"):
+        """Queue a log line; lines logged in one step land in one insert."""
+        self._log_buffer += (text + "\n", tag)
+        if self._log_flush_id is None:
+            self._log_flush_id = self.root.after_idle(self._log_flush)
+
+    def _log_flush(self):
+        self._log_flush_id = None
+        if not self._log_buffer:
+            return
         self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, text + "\n", tag)
+        self.log_text.insert(tk.END, *self._log_buffer)
         self.log_text.see(tk.END)
         self.log_text.config(state=tk.DISABLED)
+        self._log_buffer.clear()
+
+    def _clear_log(self):
+        self._log_buffer.clear()
+        self.log_text.config(state=tk.NORMAL)
+        self.log_text.delete("1.0", tk.END)
+        self.log_text.config(state=tk.DISABLED)
 
     def _explain(self, text):
         self.explain_text.config(state=tk.NORMAL)
@@ -302,12 +378,23 @@ class VisualizerApp:
         self.explain_text.insert("1.0", text)
         self.explain_text.config(state=tk.DISABLED)
 
+    def _on_canvas_resize(self, event):
+        self._cw, self._ch = event.width, event.height
+
+    def _on_map(self, event):
+        # Children inherit the toplevel's bindings; only the window counts
+        if event.widget is self.root:
+            self._visible = event.type == tk.EventType.Map
+
     def _set_phase(self, idx):
-        self.sim.phase = idx
+        if self.sim:                     # None after a reset
+            self.sim.phase = idx
         name = self.PHASE_NAMES[min(idx, len(self.PHASE_NAMES)-1)]
         self.phase_label.config(text=f"Phase: {name}")
 
     # ── Node drawing helpers ─────────────────────────────────────────
+    # A node or edge owns its canvas items for the whole run: drawing it
+    # again moves and restyles them in place rather than stacking new ones.
 
     def _draw_seed(self, node: SimNode, highlight=False):
         c = self.canvas
@@ -316,10 +403,18 @@ class VisualizerApp:
         stroke = "#ffffff" if highlight else SEED_STROKE
         w = 3 if highlight else 2
         pts = [x, y-r, x+r, y, x, y+r, x-r, y]
-        pid = c.create_polygon(pts, fill=SEED_FILL, outline=stroke, width=w)
-        tid = c.create_text(x, y, text=f"S{node.port - 5999}",
+        if node.canvas_ids:
+            pid, tid, lbl = node.canvas_ids
+            c.coords(pid, *pts)
+            c.itemconfigure(pid, outline=stroke, width=w)
+            c.coords(tid, x, y)
+            c.coords(lbl, x, y+r+14)
+            return pid
+        pid = c.create_polygon(pts, fill=SEED_FILL, outline=stroke, width=w,
+                               tags=("seed",))
+        tid = c.create_text(x, y, text=node.label,
                             fill="#1e1e2e", font=("Consolas", 9, "bold"))
-        lbl = c.create_text(x, y+r+14, text=f":{node.port}",
+        lbl = c.create_text(x, y+r+14, text=node.port_label,
                             fill=FG_DIM, font=("Consolas", 8))
         node.canvas_ids = [pid, tid, lbl]
         return pid
@@ -328,131 +423,183 @@ class VisualizerApp:
         c = self.canvas
         r = 22
         x, y = node.x, node.y
-        if node.status == "dead":
-            fill, stroke = PEER_DEAD, DEAD_STROKE
-        elif node.status == "removed":
-            fill, stroke = "#45475a", "#585b70"
-        else:
-            fill, stroke = PEER_FILL, PEER_STROKE
+        fill, stroke = PEER_STYLE[node.status]
         if highlight:
             stroke = "#ffffff"
         w = 3 if highlight else 2
-        oid = c.create_oval(x-r, y-r, x+r, y+r, fill=fill, outline=stroke, width=w)
-        tid = c.create_text(x, y, text=f"P{node.port - 6999}",
+        if node.canvas_ids:
+            oid, tid, lbl = node.canvas_ids
+            c.coords(oid, x-r, y-r, x+r, y+r)
+            c.itemconfigure(oid, fill=fill, outline=stroke, width=w)
+            c.coords(tid, x, y)
+            c.coords(lbl, x, y+r+14)
+            return oid
+        oid = c.create_oval(x-r, y-r, x+r, y+r, fill=fill, outline=stroke,
+                            width=w, tags=("peer", f"peer_{node.nid}"))
+        tid = c.create_text(x, y, text=node.label,
                             fill="#1e1e2e", font=("Consolas", 9, "bold"))
-        lbl = c.create_text(x, y+r+14, text=f":{node.port}",
+        lbl = c.create_text(x, y+r+14, text=node.port_label,
                             fill=FG_DIM, font=("Consolas", 8))
         node.canvas_ids = [oid, tid, lbl]
         return oid
 
-    def _draw_edge(self, edge: SimEdge, color=EDGE_NORMAL, width=1, dash=None):
-        na = self.sim.seeds.get(edge.a) or self.sim.peers.get(edge.a)
-        nb = self.sim.seeds.get(edge.b) or self.sim.peers.get(edge.b)
-        if not na or not nb:
-            return
-        eid = self.canvas.create_line(na.x, na.y, nb.x, nb.y,
-                                      fill=color, width=width, dash=dash)
+    def _draw_edge(self, edge: SimEdge, color=EDGE_NORMAL, width=1, dash=None,
+                   hidden=False):
+        """
+        Draw or restyle an edge's line.  hidden=True creates it invisible
+        and leaves lowering it beneath the nodes to the caller, so a batch
+        of new edges can be sent down with one tag_lower("edge").
+        """
+        na, nb = edge.node_a, edge.node_b
+        pts = (na.x, na.y, nb.x, nb.y)
+        if edge.canvas_id:
+            eid = edge.canvas_id
+            if pts != edge.drawn_at:
+                self.canvas.coords(eid, *pts)
+                edge.drawn_at = pts
+            self.canvas.itemconfigure(eid, fill=color, width=width,
+                                      dash=dash or "", state=tk.NORMAL)
+            return eid
+        eid = self.canvas.create_line(*pts, fill=color, width=width,
+                                      dash=dash, tags=("edge",),
+                                      state=tk.HIDDEN if hidden else tk.NORMAL)
         edge.canvas_id = eid
-        # Keep edges below nodes
-        self.canvas.tag_lower(eid)
+        edge.drawn_at = pts
+        if not hidden:
+            self.canvas.tag_lower(eid)     # keep edges below nodes
         return eid
 
-    def _redraw_all(self):
-        self.canvas.delete("all")
-        for e in self.sim.edges:
-            self._draw_edge(e)
-        for n in self.sim.seeds.values():
-            self._draw_seed(n)
-        for n in self.sim.peers.values():
-            self._draw_peer(n)
-
     def _animate_message(self, src: SimNode, dst: SimNode, color=MSG_BUBBLE,
                          text="", callback=None):
         """Animate a small circle traveling from src to dst."""
         c = self.canvas
         r = 6
-        ball = c.create_oval(src.x-r, src.y-r, src.x+r, src.y+r,
-                             fill=color, outline="")
-        lbl = None
+        self._ball_ids += 1
+        tag = f"ball{self._ball_ids}"     # ball + label move as one item
+        c.create_oval(src.x-r, src.y-r, src.x+r, src.y+r,
+                      fill=color, outline="", tags=(tag,))
         if text:
-            lbl = c.create_text(src.x, src.y-14, text=text, fill=color,
-                                font=("Consolas", 8, "bold"))
-        steps = 25
+            c.create_text(src.x, src.y-14, text=text, fill=color,
+                          font=("Consolas", 8, "bold"), tags=(tag,))
+        # Same travel time as 25 hops of max(15, 30/speed) ms, in frames
+        delay = max(15, int(30 / self._speed))
+        steps = max(1, round(25 * delay / FRAME_MS))
         dx = (dst.x - src.x) / steps
         dy = (dst.y - src.y) / steps
-        delay = max(15, int(30 / self.speed_scale.get()))
-
-        def step(i):
-            if i >= steps:
-                c.delete(ball)
-                if lbl:
-                    c.delete(lbl)
-                if callback:
-                    callback()
+        self._active_balls.append([tag, dx, dy, steps, callback])
+        self._wake_at(time.monotonic() + FRAME_MS / 1000)
+
+    def _at(self, ms, fn, *args):
+        """Run fn(*args) after ms, from the shared tick instead of its own timer."""
+        due = time.monotonic() + ms / 1000
+        heapq.heappush(self._timers, (due, next(self._timer_seq), fn, args))
+        self._wake_at(due)
+
+    def _wake_at(self, due):
+        """Make sure the tick runs no later than monotonic time due."""
+        if self._tick_id is not None:
+            if due >= self._tick_at:
                 return
-            c.move(ball, dx, dy)
-            if lbl:
-                c.move(lbl, dx, dy)
-            self.root.after(delay, lambda: step(i+1))
-        step(0)
+            self.root.after_cancel(self._tick_id)
+        self._tick_at = due
+        ms = max(1, math.ceil((due - time.monotonic()) * 1000))
+        self._tick_id = self.root.after(ms, self._tick)
+
+    def _tick(self):
+        """
+        Advance every in-flight ball one frame and fire due timers.  Runs
+        every frame while balls fly, else sleeps until the next timer.
+        While iconified, balls land at once instead of being animated.
+        """
+        self._tick_id = None
+        c = self.canvas
+        live, done = [], []
+        for b in self._active_balls:
+            b[3] -= 1
+            if b[3] > 0 and self._visible:
+                c.move(b[0], b[1], b[2])
+                live.append(b)
+            else:
+                c.delete(b[0])
+                done.append(b[4])
+        self._active_balls = live
+        timers, now = self._timers, time.monotonic()
+        fired = []
+        while timers and timers[0][0] <= now:
+            fired.append(heapq.heappop(timers))
+        for cb in done:
+            if cb:
+                cb()
+        for _, _, fn, args in fired:
+            fn(*args)
+        if self._active_balls:
+            self._wake_at(time.monotonic() + FRAME_MS / 1000)
+        elif self._timers:
+            self._wake_at(self._timers[0][0])
 
     def _flash_edge(self, edge: SimEdge, color, duration=800, callback=None):
         """Temporarily color an edge, then revert."""
         if edge.canvas_id:
             self.canvas.itemconfigure(edge.canvas_id, fill=color, width=2.5)
-        def revert():
-            if edge.canvas_id:
-                self.canvas.itemconfigure(edge.canvas_id, fill=EDGE_NORMAL, width=1)
-            if callback:
-                callback()
-        self.root.after(int(duration / self.speed_scale.get()), revert)
+        self._at(int(duration / self._speed),
+                 self._unflash_edge, edge, callback)
+
+    def _unflash_edge(self, edge: SimEdge, callback):
+        if edge.canvas_id:
+            self.canvas.itemconfigure(edge.canvas_id, EDGE_CFG_NORMAL)
+        if callback:
+            callback()
 
     def _flash_node(self, node: SimNode, color, duration=600, callback=None):
         if node.canvas_ids:
             self.canvas.itemconfigure(node.canvas_ids[0], outline=color, width=4)
-        def revert():
-            stroke = SEED_STROKE if node.ntype == "seed" else PEER_STROKE
-            if node.status == "dead":
-                stroke = DEAD_STROKE
-            if node.canvas_ids:
-                self.canvas.itemconfigure(node.canvas_ids[0], outline=stroke, width=2)
-            if callback:
-                callback()
-        self.root.after(int(duration / self.speed_scale.get()), revert)
-
-    def _show_vote_badge(self, node: SimNode, vote: str, duration=800):
-        """Show ✓ or ✗ near a node temporarily."""
+        self._at(int(duration / self._speed),
+                 self._unflash_node, node, callback)
+
+    def _unflash_node(self, node: SimNode, callback):
+        stroke = (SEED_STROKE if node.ntype == "seed"
+                  else PEER_STYLE[node.status][1])
+        if node.canvas_ids:
+            self.canvas.itemconfigure(node.canvas_ids[0], outline=stroke, width=2)
+        if callback:
+            callback()
+
+    def _show_vote_badges(self, nodes, vote: str, duration=800):
+        """Show ✓ or ✗ near each node temporarily; one delete clears them."""
         c = self.canvas
         txt = "✓" if vote == "YES" else "✗"
         clr = VOTE_YES if vote == "YES" else VOTE_NO
-        tid = c.create_text(node.x + 28, node.y - 20, text=txt, fill=clr,
-                            font=("Consolas", 16, "bold"))
-        self.root.after(int(duration / self.speed_scale.get()),
-                        lambda: c.delete(tid))
+        self._badge_ids += 1
+        tag = f"badge{self._badge_ids}"
+        for node in nodes:
+            c.create_text(node.x + 28, node.y - 20, text=txt, fill=clr,
+                          font=("Consolas", 16, "bold"), tags=(tag,))
+        self._at(int(duration / self._speed), c.delete, tag)
 
     # ── Layout ───────────────────────────────────────────────────────
 
     def _compute_layout(self):
-        cw = self.canvas.winfo_width() or 800
-        ch = self.canvas.winfo_height() or 550
+        cw = self._cw or 800
+        ch = self._ch or 550
         sim = self.sim
 
         # Seeds: horizontal row at top
         ns = sim.num_seeds
         spacing = min(110, (cw - 100) / max(ns, 1))
         sx = (cw - spacing * (ns - 1)) / 2
-        for i, sid in enumerate(sorted(sim.seeds)):
-            sim.seeds[sid].x = sx + i * spacing
-            sim.seeds[sid].y = 70
+        for i, node in enumerate(sim.seed_list):
+            node.x = sx + i * spacing
+            node.y = 70
 
         # Peers: circle
         np_ = sim.num_peers
         cx, cy = cw / 2, ch / 2 + 50
         r = min(cw, ch - 120) * 0.32
-        for i, pid in enumerate(sorted(sim.peers)):
-            angle = -math.pi / 2 + 2 * math.pi * i / np_
-            sim.peers[pid].x = cx + r * math.cos(angle)
-            sim.peers[pid].y = cy + r * math.sin(angle)
+        cos, sin, step = math.cos, math.sin, 2 * math.pi / np_
+        for i, node in enumerate(sim.peer_list):
+            angle = -math.pi / 2 + step * i
+            node.x = cx + r * cos(angle)
+            node.y = cy + r * sin(angle)
 
     # ── Animation queue ──────────────────────────────────────────────
 
@@ -465,9 +612,10 @@ class VisualizerApp:
             self.next_btn.config(state=tk.NORMAL)
             return
         self._anim_running = True
-        fn, args, df = self._anim_queue.pop(0)
+        fn, args, df = self._anim_queue.popleft()
         fn(*args)
-        self.root.after(self._delay(df), self._run_queue)
+        # Next step rides the shared tick, so reset cancels it with the rest
+        self._at(self._delay(df), self._run_queue)
 
     # ── Button handlers ──────────────────────────────────────────────
 
@@ -479,6 +627,10 @@ class VisualizerApp:
         except (ValueError, AssertionError):
             self._explain("Invalid input. Seeds: 1-10, Peers: 1-20.")
             return
+        if self._cw <= 1:
+            # Canvas not laid out yet — wait for its first <Configure>
+            self.root.after(50, self._on_start)
+            return
 
         self.start_btn.config(state=tk.DISABLED)
         self.seed_entry.config(state=tk.DISABLED)
@@ -486,9 +638,7 @@ class VisualizerApp:
 
         # Clear
         self.canvas.delete("all")
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.delete("1.0", tk.END)
-        self.log_text.config(state=tk.DISABLED)
+        self._clear_log()
 
         # Create simulation
         self.sim = Simulation(ns, np_)
@@ -500,6 +650,9 @@ class VisualizerApp:
             port = 7000 + i
             nid = f"127.0.0.1:{port}"
             self.sim.peers[nid] = SimNode(nid, "peer", port, 0, 0)
+        self.sim.seed_list = list(self.sim.seeds.values())
+        self.sim.peer_list = list(self.sim.peers.values())
+        self.sim.alive_peers = list(self.sim.peer_list)
         self._compute_layout()
 
         # Start phases
@@ -527,10 +680,10 @@ class VisualizerApp:
     def _on_reset(self):
         self._anim_queue.clear()
         self._anim_running = False
+        self._active_balls.clear()
+        self._timers.clear()
         self.canvas.delete("all")
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.delete("1.0", tk.END)
-        self.log_text.config(state=tk.DISABLED)
+        self._clear_log()
         self.sim = None
         self.start_btn.config(state=tk.NORMAL)
         self.seed_entry.config(state=tk.NORMAL)
@@ -554,7 +707,7 @@ class VisualizerApp:
         self._log("\n══ Phase 1: Seed Initialization ══", "header")
         self._log(f"  Quorum = ⌊{self.sim.num_seeds}/2⌋+1 = {self.sim.quorum}", "info")
 
-        for i, (sid, node) in enumerate(sorted(self.sim.seeds.items())):
+        for i, node in enumerate(self.sim.seed_list):
             self._enqueue(self._phase1_add_seed, node, i, delay_factor=1.2)
 
         self._enqueue(self._phase1_done, delay_factor=0.5)
@@ -563,8 +716,7 @@ class VisualizerApp:
     def _phase1_add_seed(self, node, idx):
         self._draw_seed(node, highlight=True)
         self._log(f"  Seed S{idx+1} started on :{node.port}", "seed")
-        self.root.after(self._delay(0.6),
-                        lambda: self._flash_node(node, SEED_STROKE))
+        self._at(self._delay(0.6), self._flash_node, node, SEED_STROKE)
 
     def _phase1_done(self):
         self._log(f"  All {self.sim.num_seeds} seeds initialized.\n", "seed")
@@ -584,8 +736,7 @@ class VisualizerApp:
         )
         self._log("══ Phase 2: Peer Registration ══", "header")
 
-        peers = list(sorted(self.sim.peers.values(), key=lambda n: n.port))
-        for peer in peers:
+        for peer in self.sim.peer_list:
             self._enqueue(self._phase2_register_peer, peer, delay_factor=2.5)
 
         self._enqueue(self._phase2_done, delay_factor=0.5)
@@ -594,10 +745,10 @@ class VisualizerApp:
     def _phase2_register_peer(self, peer: SimNode):
         # Draw the peer (faded first)
         self._draw_peer(peer)
-        self._log(f"  Peer P{peer.port-6999} (:{peer.port}) → register request", "peer")
+        self._log(f"  Peer {peer.label} (:{peer.port}) → register request", "peer")
 
         # Pick a random seed to send the request to
-        seed_list = list(self.sim.seeds.values())
+        seed_list = self.sim.seed_list
         target_seed = random.choice(seed_list)
 
         self._explain(
@@ -609,23 +760,23 @@ class VisualizerApp:
         # Animate message to seed
         def on_arrive_seed():
             self._flash_node(target_seed, "#ffffff")
-            self._log(f"    → Seed S{target_seed.port-5999} proposes registration", "seed")
+            self._log(f"    → Seed {target_seed.label} proposes registration", "seed")
             # Votes from all seeds
-            votes = 0
-            for i, seed in enumerate(seed_list):
-                vote = "YES"  # normally all approve
-                votes += 1
-                self._show_vote_badge(seed, vote, duration=1000)
-                vstr = f"    Seed S{seed.port-5999} votes {vote}  ({votes}/{self.sim.quorum})"
+            quorum, total = self.sim.quorum, self.sim.num_seeds
+            vote = "YES"  # normally all approve
+            votes = len(seed_list)
+            self._show_vote_badges(seed_list, vote, duration=1000)
+            for i, seed in enumerate(seed_list, 1):
+                vstr = f"    Seed {seed.label} votes {vote}  ({i}/{quorum})"
                 self._log(vstr, "consensus" if vote == "YES" else "reject")
 
-            approved = votes >= self.sim.quorum
+            approved = votes >= quorum
             if approved:
-                self._log(f"    ✓ CONSENSUS APPROVED — {votes}/{self.sim.num_seeds} votes", "consensus")
+                self._log(f"    ✓ CONSENSUS APPROVED — {votes}/{total} votes", "consensus")
                 peer.registered = True
                 self._flash_node(peer, VOTE_YES)
             else:
-                self._log(f"    ✗ CONSENSUS REJECTED — {votes}/{self.sim.num_seeds} votes", "reject")
+                self._log(f"    ✗ CONSENSUS REJECTED — {votes}/{total} votes", "reject")
 
         self._animate_message(peer, target_seed, color=PEER_FILL,
                               text="REG", callback=on_arrive_seed)
@@ -651,28 +802,38 @@ class VisualizerApp:
         self._log("══ Phase 3: Overlay Construction ══", "header")
 
         # Compute the actual overlay
-        peer_list = list(sorted(self.sim.peers.values(), key=lambda n: n.port))
+        peer_list = self.sim.peer_list
         n = len(peer_list)
-        for peer in peer_list:
-            others = [p for p in peer_list if p.nid != peer.nid]
+        # Every peer ranks the same n-1 others, so the Zipf ranks and the
+        # neighbour count are fixed for the whole run.
+        ranks = range(n - 1)
+        num_nbrs = min(n - 1, max(1, n // 2))
+        for i, peer in enumerate(peer_list):
+            others = peer_list[:i] + peer_list[i+1:]
             if not others:
                 continue
-            # Zipf weights
-            weights = [1.0 / (k+1) for k in range(len(others))]
-            total = sum(weights)
-            probs = [w / total for w in weights]
-            # Select floor(n/2)+1 or fewer neighbors
-            num_nbrs = min(len(others), max(1, n // 2))
-            chosen = random.choices(others, weights=probs, k=num_nbrs)
-            chosen = list({c.nid: c for c in chosen}.values())[:num_nbrs]  # dedupe
-            peer.neighbors = [c.nid for c in chosen]
+            # Zipf weights 1/(k+1), sampled without replacement: each
+            # candidate draws u^(1/w) and the largest keys win
+            # (Efraimidis–Spirakis), so no duplicates to weed out.
+            idx = heapq.nlargest(num_nbrs, ranks,
+                                 key=lambda k: random.random() ** (k + 1))
+            chosen = [others[k] for k in sorted(idx)]
+            peer.neighbors = dict.fromkeys(c.nid for c in chosen)
+            for c in chosen:
+                c.rev_neighbors.append(peer.nid)
 
             for nb in chosen:
-                key = tuple(sorted([peer.nid, nb.nid]))
-                if not any((e.a, e.b) == key or (e.b, e.a) == key for e in self.sim.edges):
-                    self.sim.edges.append(SimEdge(key[0], key[1]))
-
-        # Animate edges one by one
+                key = frozenset((peer.nid, nb.nid))
+                if key not in self.sim.edge_index:
+                    edge = (SimEdge(peer, nb) if peer.nid < nb.nid
+                            else SimEdge(nb, peer))
+                    self.sim.edge_index[key] = edge
+
+        # Lay every line down hidden beneath the nodes in one go, then
+        # reveal the edges one by one
+        for edge in self.sim.edges:
+            self._draw_edge(edge, hidden=True)
+        self.canvas.tag_lower("edge")
         for i, edge in enumerate(self.sim.edges):
             self._enqueue(self._phase3_add_edge, edge, i, delay_factor=0.6)
 
@@ -680,23 +841,19 @@ class VisualizerApp:
         self._run_queue()
 
     def _phase3_add_edge(self, edge: SimEdge, idx):
-        eid = self._draw_edge(edge, color=ACCENT, width=2)
-        na = self.sim.peers.get(edge.a)
-        nb = self.sim.peers.get(edge.b)
-        pa = na.port - 6999 if na else "?"
-        pb = nb.port - 6999 if nb else "?"
-        self._log(f"  Edge {idx+1}: P{pa} ↔ P{pb}", "edge")
+        self._draw_edge(edge, color=ACCENT, width=2)
+        self._log(f"  Edge {idx+1}: {edge.node_a.label} ↔ {edge.node_b.label}", "edge")
         # Fade to normal
-        self.root.after(self._delay(0.4),
-                        lambda: self.canvas.itemconfigure(eid, fill=EDGE_NORMAL, width=1) if eid else None)
+        self._at(self._delay(0.4), self._unflash_edge, edge, None)
 
     def _phase3_done(self):
         degrees = defaultdict(int)
         for e in self.sim.edges:
-            degrees[e.a] += 1
-            degrees[e.b] += 1
-        deg_str = ", ".join(f"P{self.sim.peers[k].port-6999}={v}"
-                           for k, v in sorted(degrees.items()) if k in self.sim.peers)
+            degrees[e.node_a] += 1
+            degrees[e.node_b] += 1
+        # peer_list is already in port order; peers without edges are left out
+        deg_str = ", ".join(f"{p.label}={degrees[p]}"
+                            for p in self.sim.peer_list if p in degrees)
         self._log(f"  Overlay: {len(self.sim.edges)} edges.  Degrees: {deg_str}\n", "info")
         self._explain(
             "Overlay complete! Notice the power-law distribution:\n"
@@ -715,13 +872,13 @@ class VisualizerApp:
             "Phase 4 — Gossip Dissemination\n\n"
             "Each peer generates messages (max 10). Format:\n"
             "  <timestamp>:<IP>:<Port>:<Msg#>\n"
-            "On first receipt: store SHA-256 hash, forward to neighbors.\n"
+            "On first receipt: store message hash, forward to neighbors.\n"
             "Duplicates are silently dropped (hash already seen)."
         )
         self._log("══ Phase 4: Gossip Dissemination ══", "header")
 
         # Simulate a few rounds of gossip
-        peer_list = [p for p in self.sim.peers.values() if p.status == "alive"]
+        peer_list = self.sim.alive_peers
         rounds = min(3, len(peer_list))
         for r in range(rounds):
             src = peer_list[r % len(peer_list)]
@@ -733,43 +890,49 @@ class VisualizerApp:
     def _phase4_gossip_round(self, src: SimNode, msg_num):
         msg_id = f"msg#{msg_num}"
         src.gossip_count += 1
+        self.sim.total_gossip += 1
         src.gossip_seen.add(msg_id)
-        self._log(f"  P{src.port-6999} generates gossip #{msg_num}", "gossip")
+        self._log(f"  {src.label} generates gossip #{msg_num}", "gossip")
         self._flash_node(src, EDGE_GOSSIP)
 
-        # Propagate to neighbors
+        # Propagate to neighbors; lit edges share a per-round tag so one
+        # itemconfigure styles them and one reverts them all.  Neighbours
+        # that already hold the message only get the id, so their edge
+        # needs no animation; if nothing was lit there is nothing to revert.
+        hot = f"gossip{msg_num}"
+        lit = False
+        peers_get, edge_get = self.sim.peers.get, self.sim.edge_index.get
+        addtag, log, src_nid = self.canvas.addtag_withtag, self._log, src.nid
         for nid in src.neighbors:
-            nb = self.sim.peers.get(nid)
+            nb = peers_get(nid)
             if not nb or nb.status != "alive":
                 continue
-            # Find the edge
-            edge = None
-            for e in self.sim.edges:
-                if (e.a == src.nid and e.b == nid) or (e.b == src.nid and e.a == nid):
-                    edge = e
-                    break
+            if msg_id in nb.gossip_seen:
+                log(f"    → {nb.label}: DUPLICATE (hash seen, dropped)", "edge")
+                continue
+
+            edge = edge_get(frozenset((src_nid, nid)))
             if edge and edge.canvas_id:
-                self.canvas.itemconfigure(edge.canvas_id, fill=EDGE_GOSSIP, width=2.5)
+                addtag(hot, edge.canvas_id)
+                lit = True
+            nb.gossip_seen.add(msg_id)
+            log(f"    → {nb.label}: NEW gossip received, forwarding…", "gossip")
 
-            is_dup = msg_id in nb.gossip_seen
-            if is_dup:
-                self._log(f"    → P{nb.port-6999}: DUPLICATE (hash seen, dropped)", "edge")
-            else:
-                nb.gossip_seen.add(msg_id)
-                self._log(f"    → P{nb.port-6999}: NEW gossip received, forwarding…", "gossip")
+        if lit:
+            self.canvas.itemconfigure(hot, EDGE_CFG_GOSSIP)
+            self._at(self._delay(1.0), self._revert_gossip, hot)
 
-            def make_revert(e):
-                return lambda: (self.canvas.itemconfigure(e.canvas_id, fill=EDGE_NORMAL, width=1)
-                                if e.canvas_id else None)
-            if edge:
-                self.root.after(self._delay(1.0), make_revert(edge))
+    def _revert_gossip(self, hot):
+        """Restore every edge lit under tag hot and drop the tag."""
+        self.canvas.itemconfigure(hot, EDGE_CFG_NORMAL)
+        self.canvas.dtag(hot, hot)
 
     def _phase4_done(self):
-        total = sum(p.gossip_count for p in self.sim.peers.values())
+        total = self.sim.total_gossip
         self._log(f"  Gossip demo complete. {total} messages generated.\n", "gossip")
         self._explain(
             "Gossip spreads through the overlay. Each peer stores the\n"
-            "SHA-256 hash of every message it has seen. If a duplicate\n"
+            "128-bit hash of every message it has seen. If a duplicate\n"
             "arrives (same hash), it is silently dropped — no loops!\n"
             "Each peer generates at most 10 messages."
         )
@@ -783,7 +946,7 @@ class VisualizerApp:
         self._set_phase(5)
 
         # Pick a victim (last peer)
-        peer_list = sorted(self.sim.peers.values(), key=lambda n: n.port)
+        peer_list = self.sim.peer_list
         self._victim = peer_list[-1] if peer_list else None
         if not self._victim:
             self.next_btn.config(state=tk.NORMAL)
@@ -791,7 +954,7 @@ class VisualizerApp:
 
         self._explain(
             f"Phase 5 — Failure Detection\n\n"
-            f"Peer P{self._victim.port-6999} (:{self._victim.port}) crashes!\n"
+            f"Peer {self._victim.label} (:{self._victim.port}) crashes!\n"
             f"Neighbors detect the failure via PING timeouts.\n"
             f"They query each other (SUSPECT_QUERY) and if a majority\n"
             f"confirms → the node is declared dead."
@@ -807,58 +970,48 @@ class VisualizerApp:
     def _phase5_kill(self):
         v = self._victim
         v.status = "dead"
-        self._log(f"  ✗ P{v.port-6999} CRASHED!", "dead")
+        self.sim.alive_peers.remove(v)
+        self._log(f"  ✗ {v.label} CRASHED!", "dead")
         # Redraw as dead
-        for cid in v.canvas_ids:
-            self.canvas.delete(cid)
         self._draw_peer(v)
         self._flash_node(v, PEER_DEAD, duration=1200)
 
     def _phase5_pings(self):
         v = self._victim
-        # Find neighbors of the victim
-        detectors = []
-        for pid, peer in self.sim.peers.items():
-            if peer.status != "alive":
-                continue
-            if v.nid in peer.neighbors:
-                detectors.append(peer)
+        # The victim's detectors are the live peers that chose it
+        peers = self.sim.peers
+        detectors = [peers[nid] for nid in v.rev_neighbors
+                     if peers[nid].status == "alive"]
 
         if not detectors:
             # Pick any alive peer
-            for peer in self.sim.peers.values():
-                if peer.status == "alive":
-                    detectors.append(peer)
-                    break
+            detectors = self.sim.alive_peers[:1]
 
         self._explain(
-            f"Neighbors of P{v.port-6999} send PING messages.\n"
+            f"Neighbors of {v.label} send PING messages.\n"
             f"No PONG reply → mark as SUSPECTED.\n"
             f"They then ask other neighbors: SUSPECT_QUERY.\n"
             f"Majority confirms → dead."
         )
 
         for det in detectors[:3]:
-            self._log(f"  P{det.port-6999} → PING → P{v.port-6999} … TIMEOUT!", "dead")
-            self._log(f"  P{det.port-6999}: P{v.port-6999} is now SUSPECTED", "dead")
+            self._log(f"  {det.label} → PING → {v.label} … TIMEOUT!", "dead")
+            self._log(f"  {det.label}: {v.label} is now SUSPECTED", "dead")
             # Animate ping
-            edge = None
-            for e in self.sim.edges:
-                if (e.a == det.nid and e.b == v.nid) or (e.b == det.nid and e.a == v.nid):
-                    edge = e; break
+            edge = self.sim.edge_index.get(frozenset((det.nid, v.nid)))
             if edge and edge.canvas_id:
-                self.canvas.itemconfigure(edge.canvas_id, fill=EDGE_PING, width=2, dash=(4, 4))
+                self.canvas.itemconfigure(edge.canvas_id, EDGE_CFG_PING)
 
         self._detectors = detectors
 
     def _phase5_consensus(self):
         v = self._victim
         # Peer-level consensus
-        confirm = len(self._detectors[:3])
+        confirm = min(len(self._detectors), 3)
         total_check = max(confirm, 2)
         self._log(f"  Peer-level consensus: {confirm}/{total_check} neighbors confirm dead", "dead")
         if confirm > total_check // 2:
-            self._log(f"  ✓ Majority confirms — P{v.port-6999} declared DEAD", "dead")
+            self._log(f"  ✓ Majority confirms — {v.label} declared DEAD", "dead")
         else:
             self._log(f"  Not enough confirmations yet", "info")
 
@@ -887,11 +1040,8 @@ class VisualizerApp:
         self._log("══ Phase 6: Dead-Node Removal ══", "header")
 
         # Pick a reporting peer
-        reporter = None
-        for peer in self.sim.peers.values():
-            if peer.status == "alive":
-                reporter = peer
-                break
+        alive = self.sim.alive_peers
+        reporter = alive[0] if alive else None
 
         if reporter:
             self._enqueue(self._phase6_report, reporter, delay_factor=2.0)
@@ -902,42 +1052,51 @@ class VisualizerApp:
 
     def _phase6_report(self, reporter: SimNode):
         v = self._victim
-        self._log(f"  P{reporter.port-6999} sends DEAD_NODE_REPORT to all seeds", "dead")
+        self._log(f"  {reporter.label} sends DEAD_NODE_REPORT to all seeds", "dead")
         self._log(f"    \"Dead Node:{v.nid}:ts:{reporter.nid.split(':')[0]}\"", "dead")
 
-        seed_list = list(self.sim.seeds.values())
+        seed_list = self.sim.seed_list
         for seed in seed_list:
             self._animate_message(reporter, seed, color=PEER_DEAD, text="DEAD")
 
     def _phase6_seed_vote(self):
         v = self._victim
-        seed_list = list(self.sim.seeds.values())
+        seed_list = self.sim.seed_list
         proposer = seed_list[0]
-        self._log(f"  Seed S{proposer.port-5999} proposes removal of P{v.port-6999}", "seed")
+        self._log(f"  Seed {proposer.label} proposes removal of {v.label}", "seed")
 
-        votes = 0
-        for seed in seed_list:
-            vote = "YES"
-            votes += 1
-            self._show_vote_badge(seed, vote, duration=1200)
-            self._log(f"    S{seed.port-5999} votes {vote}  ({votes}/{self.sim.quorum})", "consensus")
+        quorum = self.sim.quorum
+        vote = "YES"
+        votes = len(seed_list)
+        self._show_vote_badges(seed_list, vote, duration=1200)
+        for i, seed in enumerate(seed_list, 1):
+            self._log(f"    {seed.label} votes {vote}  ({i}/{quorum})", "consensus")
 
-        self._log(f"  ✓ SEED CONSENSUS APPROVED — Remove P{v.port-6999}  [{votes}/{self.sim.num_seeds}]", "consensus")
+        self._log(f"  ✓ SEED CONSENSUS APPROVED — Remove {v.label}  [{votes}/{self.sim.num_seeds}]", "consensus")
 
     def _phase6_remove(self):
         v = self._victim
         v.status = "removed"
-        # Remove edges
-        self.sim.edges = [e for e in self.sim.edges if e.a != v.nid and e.b != v.nid]
-        self._redraw_all()
-        self._log(f"  CONFIRMED REMOVAL: P{v.port-6999} removed from Peer List", "dead")
+        # Only the victim's edges and its own node change; every other
+        # item is already drawn in its resting style.
+        # Its edges are found through its own choices and the peers
+        # that chose it, so no scan over every edge.
+        edge_index = self.sim.edge_index
+        for nid in (*v.neighbors, *v.rev_neighbors):
+            e = edge_index.pop(frozenset((v.nid, nid)), None)
+            if e and e.canvas_id:
+                self.canvas.delete(e.canvas_id)
+        self._draw_peer(v)
+        self._log(f"  CONFIRMED REMOVAL: {v.label} removed from Peer List", "dead")
 
-        for peer in self.sim.peers.values():
-            if v.nid in peer.neighbors:
-                peer.neighbors.remove(v.nid)
+        for nid in v.rev_neighbors:
+            del self.sim.peers[nid].neighbors[v.nid]
+        for nid in v.neighbors:
+            self.sim.peers[nid].rev_neighbors.remove(v.nid)
+        v.rev_neighbors.clear()
 
     def _phase6_done(self):
-        alive = sum(1 for p in self.sim.peers.values() if p.status == "alive")
+        alive = len(self.sim.alive_peers)
         self._log(f"  Network now has {alive} active peers.\n", "info")
         self._explain(
             "The dead peer has been removed via two-level consensus:\n"